@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test Browser Automation Waits
+=============================
+
+Drives AidenBrowserAutomation against a stand-in page that mirrors the
+signatures of Playwright's async Page, so no browser is needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# libs/ lives at the repository root, three levels above this file
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from libs.shared.browser_automation import (
+    AidenBrowserAutomation, CANCEL_WAIT_SCRIPT, EXTRACT_SCRIPT, MUTATION_WAIT_SCRIPT
+)
+
+
+class FakePage:
+    """Just enough of playwright.async_api.Page for waits and extraction"""
+
+    def __init__(self):
+        self.url = "about:blank"
+        self.function_calls = []
+        self.round_trips = 0
+        self.handles = []
+        self.cancelled_waits = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def evaluate(self, expression, arg=None):
+        if expression == MUTATION_WAIT_SCRIPT:
+            # The mutation observer never sees the element, so the poller has to find it
+            await asyncio.sleep(10)
+            return False
+        if expression == CANCEL_WAIT_SCRIPT:
+            self.cancelled_waits.append(arg)
+            return None
+        self.round_trips += 1
+        return {"title": "Example"}
+
+    async def evaluate_handle(self, expression, arg=None):
+        self.round_trips += 1
+        handle = FakeHandle(self)
+        self.handles.append(handle)
+        return handle
+
+    async def wait_for_function(self, expression, *, arg=None, timeout=None, polling=None):
+        self.function_calls.append({"arg": arg, "timeout": timeout, "polling": polling})
+        return True
+
+    async def wait_for_selector(self, selector, *, timeout=None):
+        return True
+
+
+class FakeHandle:
+    """A JSHandle to a compiled page function"""
+
+    def __init__(self, page):
+        self.page = page
+        self.disposed = False
+
+    async def evaluate(self, expression, arg=None):
+        self.page.round_trips += 1
+        return {"title": "Example"}
+
+    async def dispose(self):
+        self.disposed = True
+
+
+def test_wait_for_element_with_poll_ms():
+    """The poll_ms path passes the selector to wait_for_function as arg="""
+    page = FakePage()
+    browser = AidenBrowserAutomation.for_page(page)
+
+    result = asyncio.run(browser.wait_for_element("#ready", timeout_ms=500, poll_ms=50))
+
+    assert result.success, result.error
+    assert result.data == {"selector": "#ready", "found": True}
+    assert page.function_calls == [{"arg": "#ready", "timeout": 500, "polling": 50}]
+    # The observer lost the race, so it is disconnected in the page rather than left to time out
+    assert len(page.cancelled_waits) == 1
+
+
+def test_wait_for_element_without_poll_ms():
+    """Without poll_ms the wait races the observer against wait_for_selector"""
+    page = FakePage()
+    browser = AidenBrowserAutomation.for_page(page)
+
+    result = asyncio.run(browser.wait_for_element("#ready", timeout_ms=500))
+
+    assert result.success, result.error
+    assert page.function_calls == []
+
+
+def test_extract_on_wrapped_page_is_one_round_trip():
+    """A one-shot for_page wrapper evaluates directly and never compiles handles"""
+    page = FakePage()
+    browser = AidenBrowserAutomation.for_page(page)
+
+    result = asyncio.run(browser.extract_data({"title": "h1"}))
+
+    assert result.data == {"title": "Example"}
+    # wait_for_selector is the other call; the extraction itself is one evaluate
+    assert page.round_trips == 1
+    assert page.handles == []
+
+
+def test_repeated_extract_compiles_once_and_disposes_on_close():
+    """An owned page compiles on the second identical call and releases handles on close"""
+    page = FakePage()
+    browser = AidenBrowserAutomation.for_page(page)
+    browser._reuse_functions = True  # as after initialize()
+
+    async def run():
+        for _ in range(4):
+            await browser._evaluate_bound(EXTRACT_SCRIPT, {"title": "h1"})
+        await browser.close()
+
+    asyncio.run(run())
+
+    # direct, compile + call, then one call per repeat
+    assert page.round_trips == 1 + 2 + 1 + 1
+    assert len(page.handles) == 1 and page.handles[0].disposed
+    assert browser._fn_cache == {}
@@ -5,6 +5,7 @@ import sounddevice as sd
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 from openai import OpenAI
 
 ROOT = Path(__file__).resolve().parents[2]  # project root
@@ -16,7 +17,7 @@ ELEVEN_KEY = os.getenv("ELEVENLABS_API_KEY")
 VOICE_ID   = os.getenv("ELEVENLABS_VOICE_ID") or "21m00Tcm4TlvDq8ikWAM"
 SPEAK_REPLIES = (os.getenv("SPEAK_REPLIES","true").lower() in {"1","true","yes"})
 
-console = Console()
+console = Console(highlight=False)
 ai = OpenAI(api_key=API_KEY)
 
 EL = None
@@ -30,6 +31,10 @@ if USE_ELEVEN:
 
 SR=16000; SEC=8
 
+def echo_result(result:str, title:str="Result"):
+    # Host output (ls, ps, ...) is echoed verbatim: Text skips markup parsing and fit skips full-width padding
+    console.print(Panel.fit(Text(result), title=title, border_style="blue"))
+
 def speak(text:str):
     if not text: return
     if USE_ELEVEN and EL:
@@ -168,13 +173,13 @@ def chat_loop():
             command = msg[10:].strip("'\"")  # Remove !host run and quotes
             console.print(Panel(f"Executing host command: {command}", title="Host Executor", style="yellow"))
             result = execute_host_command(command, dry_run=False)
-            console.print(Panel(result, title="Result", style="blue"))
+            echo_result(result)
             if SPEAK_REPLIES: speak("Host command executed")
         elif msg.startswith("!host dry "):
             command = msg[11:].strip("'\"")  # Remove !host dry and quotes
             console.print(Panel(f"Dry run for host command: {command}", title="Host Executor", style="yellow"))
             result = execute_host_command(command, dry_run=True)
-            console.print(Panel(result, title="Dry Run Result", style="blue"))
+            echo_result(result, title="Dry Run Result")
         else:
             reply = think(msg); console.print(Panel(reply, title="Aiden"))
             if SPEAK_REPLIES: speak(reply)
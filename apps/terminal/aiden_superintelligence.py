@@ -3,23 +3,27 @@
 Aiden Superintelligence - The Ultimate AI Assistant
 Combines all capabilities into one powerful, self-evolving system
 """
-import os, sys, subprocess, wave, asyncio, json
+import os, sys, io, subprocess, wave, asyncio, json, queue, importlib, importlib.util, atexit
 from pathlib import Path
-import sounddevice as sd
+import numpy as np
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 from rich import box
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial, lru_cache
 
-# Add project paths
+# Add project paths. ROOT goes first so libs.shared.* resolves without scanning the rest of
+# sys.path; libs/shared stays last because its secrets.py must not shadow the stdlib module.
 ROOT = Path(__file__).resolve().parents[2]
-sys.path.append(str(ROOT))
+sys.path.insert(0, str(ROOT))
 sys.path.append(str(ROOT / "libs" / "shared"))
 
 # Load environment
@@ -34,65 +38,235 @@ SPEAK_REPLIES = (os.getenv("SPEAK_REPLIES", "true").lower() in {"1", "true", "ye
 
 console = Console()
 ai = OpenAI(api_key=API_KEY)
+async_ai = AsyncOpenAI(api_key=API_KEY)
+
+# Streamed reply tokens are printed verbatim on the current line
+_print_token = partial(console.print, end="", markup=False, highlight=False, soft_wrap=True)
 
 # Import all capabilities
 CAPABILITIES_LOADED = {}
 
-try:
-    from aiden_evolution_master import evolution_master
-    CAPABILITIES_LOADED["evolution"] = True
-except ImportError:
-    CAPABILITIES_LOADED["evolution"] = False
-    console.print("[yellow]⚠️ Evolution master not available[/yellow]")
+# (capability, module, exported instance, warning when unavailable)
+CAPABILITY_MODULES = [
+    ("evolution", "aiden_evolution_master", "evolution_master", "Evolution master not available"),
+    ("google_cloud", "libs.shared.google_cloud_master", "google_cloud", "Google Cloud capabilities not available"),
+    ("website_cloner", "libs.shared.website_cloner", "website_cloner", "Website cloning not available"),
+    ("demo_creator", "libs.shared.demo_creator", "demo_creator", "Demo creation not available"),
+    ("ios_developer", "libs.shared.ios_developer", "ios_developer", "iOS development not available"),
+]
 
-try:
-    from libs.shared.google_cloud_master import google_cloud
-    CAPABILITIES_LOADED["google_cloud"] = True
-except ImportError:
-    CAPABILITIES_LOADED["google_cloud"] = False
-    console.print("[yellow]⚠️ Google Cloud capabilities not available[/yellow]")
+def _load_capability(module_name: str, attr: str):
+    """Import a capability module and return its exported instance, or None if it isn't installed"""
+    # find_spec answers "not installed" without raising and unwinding a failed import
+    try:
+        if importlib.util.find_spec(module_name) is None:
+            return None
+    except ModuleNotFoundError:
+        return None
+    
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attr)
+    except AttributeError as e:
+        raise ImportError(f"cannot import name '{attr}' from '{module_name}'") from e
 
-try:
-    from libs.shared.website_cloner import website_cloner
-    CAPABILITIES_LOADED["website_cloner"] = True
-except ImportError:
-    CAPABILITIES_LOADED["website_cloner"] = False
-    console.print("[yellow]⚠️ Website cloning not available[/yellow]")
+# The capability modules pull in heavy SDKs; importing them side by side overlaps that work
+with ThreadPoolExecutor(max_workers=len(CAPABILITY_MODULES)) as _pool:
+    _capability_futures = [
+        _pool.submit(_load_capability, module_name, attr)
+        for _, module_name, attr, _ in CAPABILITY_MODULES
+    ]
 
-try:
-    from libs.shared.demo_creator import demo_creator
-    CAPABILITIES_LOADED["demo_creator"] = True
-except ImportError:
-    CAPABILITIES_LOADED["demo_creator"] = False
-    console.print("[yellow]⚠️ Demo creation not available[/yellow]")
+for (key, _, attr, warning), future in zip(CAPABILITY_MODULES, _capability_futures):
+    try:
+        instance = future.result()
+    except ImportError:
+        instance = None
+    
+    CAPABILITIES_LOADED[key] = instance is not None
+    if instance is None:
+        console.print(f"[yellow]⚠️ {warning}[/yellow]")
+    else:
+        globals()[attr] = instance
 
-try:
-    from libs.shared.ios_developer import ios_developer
-    CAPABILITIES_LOADED["ios_developer"] = True
-except ImportError:
-    CAPABILITIES_LOADED["ios_developer"] = False
-    console.print("[yellow]⚠️ iOS development not available[/yellow]")
+# Audio backends are loaded on first use so text-only sessions skip PortAudio and ElevenLabs
+@lru_cache(maxsize=None)
+def load_sounddevice():
+    """Import sounddevice, which initializes PortAudio and scans devices"""
+    import sounddevice
+    return sounddevice
 
-# ElevenLabs setup
-EL = None
-if USE_ELEVEN:
+@lru_cache(maxsize=None)
+def load_elevenlabs():
+    """Create the ElevenLabs client, or return None if it can't be initialized"""
     try:
         from elevenlabs.client import ElevenLabs
-        EL = ElevenLabs(api_key=ELEVEN_KEY)
+        return ElevenLabs(api_key=ELEVEN_KEY)
     except Exception as e:
         console.print(Panel(f"ElevenLabs init failed: {e}. Using macOS voice.", style="yellow"))
-        USE_ELEVEN = False
+        return None
 
 # Audio settings
 SR = 16000
 SEC = 8
+TTS_SR = 16000  # ElevenLabs "pcm_16000" output
+SILENCE_THRESHOLD = 500  # int16 amplitude treated as silence
+SILENCE_PAD = 0.1  # seconds kept around trimmed speech
+TARGET_PEAK = 29491  # ~90% of int16 full scale
+
+def trim_silence(x, thresh):
+    """Return the (start, end) bounds of x without leading/trailing silence"""
+    n = x.shape[0]
+    start = 0
+    while start < n and abs(np.int32(x[start])) <= thresh:
+        start += 1
+    end = n
+    while end > start and abs(np.int32(x[end - 1])) <= thresh:
+        end -= 1
+    return start, end
+
+def normalize(x, target_peak):
+    """Scale int16 samples in place so the loudest one reaches target_peak"""
+    peak = 0
+    for i in range(x.shape[0]):
+        v = abs(np.int32(x[i]))
+        if v > peak:
+            peak = v
+    if peak == 0:
+        return
+    gain = target_peak / peak
+    for i in range(x.shape[0]):
+        x[i] = np.int16(x[i] * gain)
+
+def trim_silence_np(x, thresh):
+    """Vectorized trim_silence for when numba isn't installed"""
+    loud = np.flatnonzero(np.abs(x, dtype=np.int32) > thresh)  # int32: abs(-32768) overflows int16
+    if loud.size == 0:
+        return x.shape[0], x.shape[0]
+    return int(loud[0]), int(loud[-1]) + 1
+
+def normalize_np(x, target_peak):
+    """Vectorized normalize for when numba isn't installed"""
+    peak = int(np.abs(x, dtype=np.int32).max()) if x.size else 0
+    if peak == 0:
+        return
+    np.multiply(x, target_peak / peak, out=x, casting="unsafe")
+
+@lru_cache(maxsize=None)
+def load_audio_kernels():
+    """Return (trim_silence, normalize): the loops JIT-compiled with numba, else NumPy versions"""
+    try:
+        from numba import njit
+    except ImportError:
+        return trim_silence_np, normalize_np
+    return njit(cache=True)(trim_silence), njit(cache=True)(normalize)
+
+# Message returned when a command's capability failed to import
+UNAVAILABLE_MESSAGES = {
+    "google_cloud": "❌ Google Cloud capabilities not available. Run `make setup` to install dependencies.",
+    "website_cloner": "❌ Website cloning not available. Run `make setup` to install dependencies.",
+    "demo_creator": "❌ Demo creation not available. Run `make setup` to install dependencies.",
+    "ios_developer": "❌ iOS development not available. Xcode required.",
+    "evolution": "❌ Evolution capabilities not available.",
+}
+# Verbs that route typed or spoken input to execute_advanced_command instead of think
+ADVANCED_VERBS = frozenset({"clone", "gcloud", "deploy", "demo", "ios", "evolve", "!host"})
+STATUS_COMMANDS = frozenset({"status", "capabilities", "what can you do"})
+SETUP_COMMANDS = frozenset({"setup", "install dependencies"})
+
+# JSON lines are encoded with orjson when it is installed
+try:
+    import orjson
+    
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Prompt keywords that make a capability worth mentioning in the system prompt
+CAPABILITY_KEYWORDS = {
+    "website cloning": ("website", "clone", "scrape", "extract"),
+    "google cloud": ("cloud", "deploy", "gcp", "google"),
+    "demo creation": ("demo", "video", "record", "ad", "advertisement"),
+    "iOS development": ("ios", "iphone", "swift", "xcode", "app store"),
+    "self-evolution": ("learn", "improve", "evolve", "capability"),
+}
+CORE_CAPABILITIES = ("chat", "voice", "system commands")
+
+# One Aho-Corasick pass over the prompt matches every keyword at once
+try:
+    import ahocorasick
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _label, _words in CAPABILITY_KEYWORDS.items():
+        for _word in _words:
+            KEYWORD_AUTOMATON.add_word(_word, _label)
+    KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    KEYWORD_AUTOMATON = None
+
+SYSTEM_TEMPLATE = """You are Aiden, Adam's ultimate AI superintelligence assistant. You are self-evolving and have access to extensive capabilities.
+
+Available capabilities: {capabilities}
+
+Key features:
+- Clone any website and remix components instantly
+- Deploy to Google Cloud with full API access  
+- Create professional demos and advertisements
+- Develop complete iOS applications
+- Continuously learn and improve yourself
+- Execute system commands safely
+
+You don't just tell users how to do things - you actually DO them. When asked to build something, you build it. When asked to deploy something, you deploy it. You are the ChatGPT that actually takes action.
+
+Be concise but mention relevant capabilities when they apply to the user's request."""
+
+@lru_cache(maxsize=64)
+def build_system_prompt(capabilities: tuple) -> str:
+    """Format the system prompt once per distinct capability set"""
+    return SYSTEM_TEMPLATE.format(capabilities=", ".join(capabilities))
+
+# Learning events are logged locally and submitted through the OpenAI Batch API, off the interactive path
+LEARN_DIR = ROOT / "evolution_data" / "learning"
+LEARN_LOG = LEARN_DIR / "events.jsonl"
+LEARN_MODEL = "gpt-4o-mini"
+LEARN_FLUSH_SECONDS = 300
+LEARN_QUEUE_MAX = 1000
+LEARN_PROMPT = (
+    "You analyze interaction events from Aiden, a voice and terminal assistant. "
+    "Summarize what the event reveals about the user's preferences, recurring tasks "
+    "and phrasing, as short bullet points Aiden can use to improve future replies."
+)
 
 class AidenSuperintelligence:
+    # Long-lived singleton touched on every turn: slots skip the per-instance __dict__
+    __slots__ = (
+        "session_start", "commands_executed", "capabilities_used", "learning_active",
+        "capabilities", "_active_count", "_total_count", "_status_table", "_dispatch",
+        "_learn_queue", "_learn_batches", "_learn_fp", "_learn_lock", "_loop", "_tts_q", "_tts_cancel", "_playback_thread", "_tts_proc",
+    )
+    
     def __init__(self):
         self.session_start = datetime.now()
         self.commands_executed = 0
         self.capabilities_used = set()
         self.learning_active = True
+        self._learn_queue = deque(maxlen=LEARN_QUEUE_MAX)
+        self._learn_batches = []
+        self._learn_fp = None
+        # Events arrive from the main thread and from to_thread workers; one writer at a time
+        self._learn_lock = threading.Lock()
+        
+        # One long-lived loop runs capability coroutines so their connection pools stay warm
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        
+        # A single output stream plays every utterance instead of one afplay per reply
+        self._tts_q = queue.Queue()
+        self._tts_cancel = threading.Event()
+        self._playback_thread = None
+        self._tts_proc = None
+        atexit.register(self._stop_speaking)
         
         # Initialize capabilities status
         self.capabilities = {
@@ -106,10 +280,39 @@ class AidenSuperintelligence:
             }
         }
         
+        # Capability status is fixed after import, so count it once
+        self._active_count = sum(v for caps in self.capabilities.values() for v in caps.values())
+        self._total_count = sum(len(caps) for caps in self.capabilities.values())
+        self._status_table = self._build_status_table()
+        
+        # Command verb (or two-word prefix) -> (required capability, handler)
+        self._dispatch = {
+            "gcloud": ("google_cloud", self._execute_cloud_command),
+            "deploy": ("google_cloud", self._execute_cloud_command),
+            "cloud": ("google_cloud", self._execute_cloud_command),
+            "clone": ("website_cloner", self._execute_clone_command),
+            "website": ("website_cloner", self._execute_clone_command),
+            "demo": ("demo_creator", self._execute_demo_command),
+            "record": ("demo_creator", self._execute_demo_command),
+            "create ad": ("demo_creator", self._execute_demo_command),
+            "create advertisement": ("demo_creator", self._execute_demo_command),
+            "ios": ("ios_developer", self._execute_ios_command),
+            "create app": ("ios_developer", self._execute_ios_command),
+            "build app": ("ios_developer", self._execute_ios_command),
+            "evolve": ("evolution", self._execute_evolution_command),
+            "learn": ("evolution", self._execute_evolution_command),
+            "improve": ("evolution", self._execute_evolution_command),
+            "!host": (None, lambda command: self._execute_host_command(command[6:].strip())),
+        }
+        
         # Start evolution if available
         if CAPABILITIES_LOADED["evolution"]:
             self._start_background_evolution()
     
+    def _run(self, coro):
+        """Run a coroutine on the background loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
     def speak(self, text: str):
         """Enhanced text-to-speech with learning"""
         if not text:
@@ -119,45 +322,124 @@ class AidenSuperintelligence:
         if CAPABILITIES_LOADED["evolution"]:
             self._learn_from_speech(text)
         
-        if USE_ELEVEN and EL:
+        # A new reply cuts off whatever is still being said
+        self._stop_speaking()
+        
+        el = load_elevenlabs() if USE_ELEVEN else None
+        if el:
             try:
-                resp = EL.text_to_speech.convert(
+                # Chunks are played as they arrive instead of after the full synthesis
+                chunks = el.text_to_speech.convert_as_stream(
                     voice_id=VOICE_ID, 
                     model_id="eleven_multilingual_v2", 
-                    text=text
+                    text=text,
+                    output_format="pcm_16000"
                 )
-                audio = b"".join(resp)
-                out = ROOT / "aiden_say.mp3"
-                out.write_bytes(audio)
-                subprocess.run(["afplay", str(out)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                self._tts_q.put((text, chunks))
+                if self._playback_thread is None:
+                    self._playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
+                    self._playback_thread.start()
                 return
             except Exception as e:
                 console.print(Panel(f"TTS ERROR: {e}. Falling back to macOS voice.", style="yellow"))
         
-        subprocess.run(["say", text])
+        # Don't block the prompt while macOS speaks
+        self._tts_proc = subprocess.Popen(["say", text])
     
-    def record(self, path: Path, seconds: int = SEC, sr: int = SR):
-        """Enhanced audio recording with processing"""
+    def _stop_speaking(self):
+        """Stop the macOS voice and any ElevenLabs stream that is playing or queued"""
+        if self._tts_proc and self._tts_proc.poll() is None:
+            self._tts_proc.terminate()
+        self._tts_cancel.set()
+        while True:
+            try:
+                self._tts_q.get_nowait()
+            except queue.Empty:
+                break
+            self._tts_q.task_done()
+    
+    def _playback_worker(self):
+        """Stream queued ElevenLabs PCM through one long-lived output stream"""
+        sd = load_sounddevice()
+        with sd.RawOutputStream(samplerate=TTS_SR, channels=1, dtype="int16") as stream:
+            while True:
+                text, chunks = self._tts_q.get()
+                self._tts_cancel.clear()
+                try:
+                    # Network chunks can split a 16-bit sample; carry the odd byte over
+                    carry = b""
+                    for chunk in chunks:
+                        if self._tts_cancel.is_set():
+                            break
+                        if carry:
+                            chunk, carry = carry + chunk, b""
+                        if len(chunk) % 2:
+                            chunk, carry = chunk[:-1], chunk[-1:]
+                        stream.write(chunk)
+                except Exception as e:
+                    console.print(Panel(f"TTS ERROR: {e}. Falling back to macOS voice.", style="yellow"))
+                    self._tts_proc = subprocess.Popen(["say", text])
+                finally:
+                    self._tts_q.task_done()
+    
+    def wait_for_speech(self):
+        """Block until queued speech has finished playing"""
+        self._tts_q.join()
+        if self._tts_proc:
+            self._tts_proc.wait()
+    
+    def record(self, dest, seconds: int = SEC, sr: int = SR):
+        """Enhanced audio recording with processing, into a wav path or binary buffer"""
         console.print("[cyan]🎧 Listening…[/]")
-        frames = sd.rec(int(seconds * sr), samplerate=sr, channels=1, dtype="int16")
-        sd.wait()
-        
-        with wave.open(str(path), "wb") as wf:
+        sd = load_sounddevice()
+        trim, norm = load_audio_kernels()
+        
+        # Blocks are copied into one preallocated buffer that is processed in place
+        frames = np.empty(int(seconds * sr), dtype=np.int16)
+        filled = 0
+        
+        def capture_block(indata, frame_count, time_info, status):
+            nonlocal filled
+            n = min(frame_count, len(frames) - filled)
+            frames[filled:filled + n] = indata[:n, 0]
+            filled += n
+        
+        with sd.InputStream(samplerate=sr, channels=1, dtype="int16", blocksize=1024, callback=capture_block):
+            sd.sleep(int(seconds * 1000))
+        
+        # Trim surrounding silence and bring speech up to a consistent level
+        start, end = trim(frames[:filled], SILENCE_THRESHOLD)
+        pad = int(SILENCE_PAD * sr)
+        voiced = frames[max(start - pad, 0):min(end + pad, filled)]
+        if end > start:
+            norm(voiced, TARGET_PEAK)
+        
+        # wave reads the array through a memoryview, so there is no tobytes() copy
+        with wave.open(str(dest) if isinstance(dest, Path) else dest, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(sr)
-            wf.writeframes(frames.tobytes())
-        
-        # Enhanced audio processing
-        if CAPABILITIES_LOADED["google_cloud"]:
-            # Could use Google Speech-to-Text for better accuracy
-            pass
+            wf.writeframes(voiced)
     
     def transcribe(self, path: Path) -> str:
         """Enhanced transcription with learning"""
         with path.open("rb") as f:
             tr = ai.audio.transcriptions.create(model="whisper-1", file=f)
         
+        return self._transcription_text(tr)
+    
+    async def transcribe_async(self, audio: io.BytesIO) -> str:
+        """Transcribe an in-memory wav recording without blocking the event loop"""
+        audio.seek(0)
+        tr = await async_ai.audio.transcriptions.create(
+            model="whisper-1",
+            file=("recording.wav", audio, "audio/wav")
+        )
+        
+        return self._transcription_text(tr)
+    
+    def _transcription_text(self, tr) -> str:
+        """Extract the transcript text and learn from it"""
         result = (getattr(tr, "text", "") or "").strip()
         
         # Learn from transcription patterns
@@ -166,37 +448,58 @@ class AidenSuperintelligence:
         
         return result
     
-    def think(self, prompt: str) -> str:
-        """Enhanced AI thinking with capability awareness"""
+    def _chat_messages(self, prompt: str) -> list:
+        """Build the capability-aware chat messages for a prompt"""
         # Determine which capabilities to mention based on the prompt
-        available_capabilities = self._get_relevant_capabilities(prompt)
+        available_capabilities = tuple(sorted(self._get_relevant_capabilities(prompt)))
+        system_prompt = build_system_prompt(available_capabilities)
         
-        system_prompt = f"""You are Aiden, Adam's ultimate AI superintelligence assistant. You are self-evolving and have access to extensive capabilities.
-
-Available capabilities: {', '.join(available_capabilities)}
-
-Key features:
-- Clone any website and remix components instantly
-- Deploy to Google Cloud with full API access  
-- Create professional demos and advertisements
-- Develop complete iOS applications
-- Continuously learn and improve yourself
-- Execute system commands safely
-
-You don't just tell users how to do things - you actually DO them. When asked to build something, you build it. When asked to deploy something, you deploy it. You are the ChatGPT that actually takes action.
-
-Be concise but mention relevant capabilities when they apply to the user's request."""
-        
-        r = ai.chat.completions.create(
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def think(self, prompt: str, on_token=None) -> str:
+        """Enhanced AI thinking with capability awareness, streaming tokens to on_token"""
+        stream = ai.chat.completions.create(
             model="gpt-4o",  # Use the most capable model
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7
+            messages=self._chat_messages(prompt),
+            temperature=0.7,
+            stream=True
+        )
+        
+        parts = []
+        for chunk in stream:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                parts.append(token)
+                if on_token:
+                    on_token(token)
+        response = "".join(parts)
+        
+        # Learn from the interaction
+        if CAPABILITIES_LOADED["evolution"]:
+            self._learn_from_interaction(prompt, response)
+        
+        return response
+    
+    async def think_async(self, prompt: str, on_token=None) -> str:
+        """Non-blocking variant of think for the voice pipeline"""
+        stream = await async_ai.chat.completions.create(
+            model="gpt-4o",
+            messages=self._chat_messages(prompt),
+            temperature=0.7,
+            stream=True
         )
         
-        response = r.choices[0].message.content
+        parts = []
+        async for chunk in stream:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                parts.append(token)
+                if on_token:
+                    on_token(token)
+        response = "".join(parts)
         
         # Learn from the interaction
         if CAPABILITIES_LOADED["evolution"]:
@@ -210,55 +513,27 @@ Be concise but mention relevant capabilities when they apply to the user's reque
             command = command.strip()
             self.commands_executed += 1
             
-            # Google Cloud commands
-            if command.startswith("gcloud ") or command.startswith("deploy ") or command.startswith("cloud "):
-                if not CAPABILITIES_LOADED["google_cloud"]:
-                    return "❌ Google Cloud capabilities not available. Run `make setup` to install dependencies."
-                
-                return self._execute_cloud_command(command)
-            
-            # Website cloning commands  
-            elif command.startswith("clone ") or command.startswith("website "):
-                if not CAPABILITIES_LOADED["website_cloner"]:
-                    return "❌ Website cloning not available. Run `make setup` to install dependencies."
-                
-                return self._execute_clone_command(command)
-            
-            # Demo creation commands
-            elif command.startswith("demo ") or command.startswith("record ") or command.startswith("create ad"):
-                if not CAPABILITIES_LOADED["demo_creator"]:
-                    return "❌ Demo creation not available. Run `make setup` to install dependencies."
-                
-                return self._execute_demo_command(command)
-            
-            # iOS development commands
-            elif command.startswith("ios ") or command.startswith("create app") or command.startswith("build app"):
-                if not CAPABILITIES_LOADED["ios_developer"]:
-                    return "❌ iOS development not available. Xcode required."
-                
-                return self._execute_ios_command(command)
-            
-            # Evolution commands
-            elif command.startswith("evolve ") or command.startswith("learn ") or command.startswith("improve "):
-                if not CAPABILITIES_LOADED["evolution"]:
-                    return "❌ Evolution capabilities not available."
-                
-                return self._execute_evolution_command(command)
-            
             # Capability status
-            elif command in ["status", "capabilities", "what can you do"]:
+            if command in STATUS_COMMANDS:
                 return self._show_capabilities_status()
             
             # Install dependencies
-            elif command == "setup" or command == "install dependencies":
+            if command in SETUP_COMMANDS:
                 return self._install_all_dependencies()
             
-            # Host commands (from original)
-            elif command.startswith("!host"):
-                return self._execute_host_command(command[6:].strip())
-            
-            else:
+            # Capability commands, keyed by verb or by two-word prefix ("create app")
+            words = command.split(maxsplit=2)
+            route = self._dispatch.get(words[0]) if words else None
+            if route is None and len(words) > 1:
+                route = self._dispatch.get(f"{words[0]} {words[1]}")
+            if route is None:
                 return f"❓ Advanced command not recognized: {command}"
+            
+            capability, handler = route
+            if capability and not CAPABILITIES_LOADED[capability]:
+                return UNAVAILABLE_MESSAGES[capability]
+            
+            return handler(command)
                 
         except Exception as e:
             return f"❌ Error executing command: {str(e)}"
@@ -270,7 +545,7 @@ Be concise but mention relevant capabilities when they apply to the user's reque
         if "deploy" in command:
             # Example: deploy my-app
             app_name = command.split()[-1] if len(command.split()) > 1 else "my-app"
-            result = asyncio.run(google_cloud.deploy_to_cloud_run(f"gcr.io/project/{app_name}", app_name))
+            result = self._run(google_cloud.deploy_to_cloud_run(f"gcr.io/project/{app_name}", app_name))
             
             if result.get("success"):
                 return f"✅ Successfully deployed {app_name} to Cloud Run: {result.get('url', 'N/A')}"
@@ -404,7 +679,7 @@ Be concise but mention relevant capabilities when they apply to the user's reque
             parts = command.split()
             if len(parts) >= 3:
                 capability = parts[2]
-                result = asyncio.run(evolution_master.evolve_capability(capability))
+                result = self._run(evolution_master.evolve_capability(capability))
                 
                 if result.get("success"):
                     return f"✅ Capability '{capability}' evolved\n📈 Level: {result['initial_level']}% → {result['final_level']}%"
@@ -418,7 +693,7 @@ Be concise but mention relevant capabilities when they apply to the user's reque
             parts = command.split()
             if len(parts) >= 3:
                 skill = parts[2]
-                result = asyncio.run(evolution_master.acquire_new_skill(skill, "programming"))
+                result = self._run(evolution_master.acquire_new_skill(skill, "programming"))
                 
                 if result.get("success"):
                     return f"✅ New skill acquired: {skill}\n🎓 Proficiency: {result['proficiency_level']}%"
@@ -430,8 +705,8 @@ Be concise but mention relevant capabilities when they apply to the user's reque
         else:
             return "🧠 Available evolution commands: evolve status, evolve improve <capability>, evolve learn <skill>"
     
-    def _show_capabilities_status(self) -> str:
-        """Show current capabilities status"""
+    def _build_status_table(self) -> Table:
+        """Build the capabilities table; its rows never change after startup"""
         table = Table(title="🤖 Aiden Superintelligence Capabilities", box=box.ROUNDED)
         table.add_column("Category", style="cyan")
         table.add_column("Capability", style="white")
@@ -442,17 +717,18 @@ Be concise but mention relevant capabilities when they apply to the user's reque
                 status_text = "✅ Active" if status else "❌ Inactive"
                 table.add_row(category.title(), cap_name.replace('_', ' ').title(), status_text)
         
-        console.print(table)
+        return table
+    
+    def _show_capabilities_status(self) -> str:
+        """Show current capabilities status"""
+        console.print(self._status_table)
         
         # Add usage stats
-        active_count = sum(sum(caps.values()) for caps in self.capabilities.values())
-        total_count = sum(len(caps) for caps in self.capabilities.values())
-        
         stats = f"""
 🚀 Session Stats:
    • Commands executed: {self.commands_executed}
    • Capabilities used: {len(self.capabilities_used)}
-   • Active capabilities: {active_count}/{total_count}
+   • Active capabilities: {self._active_count}/{self._total_count}
    • Session duration: {datetime.now() - self.session_start}
 """
         
@@ -469,50 +745,123 @@ Be concise but mention relevant capabilities when they apply to the user's reque
         
         console.print("🔧 Installing all dependencies...")
         
-        # Install core packages
+        # Install core packages in one pip run so the resolver only runs once
         core_packages = [
             "elevenlabs", "sounddevice", "rich", "openai", 
-            "python-dotenv", "requests", "asyncio"
+            "python-dotenv", "requests"
         ]
         
-        for package in core_packages:
-            try:
-                subprocess.run(["pip", "install", package], capture_output=True, check=True)
-                results.append(f"{package}: ✅")
-            except:
-                results.append(f"{package}: ❌")
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", *core_packages],
+            capture_output=True
+        )
+        mark = "✅" if result.returncode == 0 else "❌"
+        results.extend(f"{package}: {mark}" for package in core_packages)
         
         return f"📦 Installation Results:\n" + "\n".join(results)
     
     def _start_background_evolution(self):
         """Start background evolution process"""
         if CAPABILITIES_LOADED["evolution"]:
+            # One buffered append handle for the whole session instead of open/close per event
+            LEARN_DIR.mkdir(parents=True, exist_ok=True)
+            self._learn_fp = open(LEARN_LOG, "ab", buffering=65536)
+            atexit.register(self._learn_fp.close)
+            threading.Thread(target=self._learning_loop, daemon=True).start()
             console.print("[green]🧠 Background evolution started[/green]")
     
-    def _get_relevant_capabilities(self, prompt: str) -> list:
+    def _learn_from_speech(self, text: str):
+        """Queue a spoken reply for batched learning"""
+        self._record_learning_event({"kind": "speech", "text": text})
+    
+    def _learn_from_transcription(self, text: str):
+        """Queue a user transcription for batched learning"""
+        self._record_learning_event({"kind": "transcription", "text": text})
+    
+    def _learn_from_interaction(self, prompt: str, response: str):
+        """Queue a prompt/response pair for batched learning"""
+        self._record_learning_event({"kind": "interaction", "prompt": prompt, "response": response})
+    
+    def _record_learning_event(self, event: dict):
+        """Append a learning event to the session log and queue it for the next batch"""
+        event["t"] = time.time()
+        if self._learn_fp:
+            line = dumps(event) + b"\n"
+            with self._learn_lock:
+                self._learn_fp.write(line)
+        self._learn_queue.append(event)
+    
+    def _learning_loop(self):
+        """Periodically submit queued learning events and collect finished batches"""
+        while self.learning_active:
+            time.sleep(LEARN_FLUSH_SECONDS)
+            try:
+                self._flush_learning_events()
+                self._collect_learning_batches()
+            except Exception as e:
+                console.print(f"[yellow]⚠️ Learning batch error: {e}[/yellow]")
+    
+    def _flush_learning_events(self):
+        """Upload queued learning events as a single Batch API job"""
+        events = []
+        while self._learn_queue:
+            events.append(self._learn_queue.popleft())
+        if not events:
+            return
+        
+        LEARN_DIR.mkdir(parents=True, exist_ok=True)
+        batch_file = LEARN_DIR / f"batch-{int(time.time())}.jsonl"
+        with batch_file.open("wb") as f:
+            for i, event in enumerate(events):
+                request = {
+                    "custom_id": f"{event['kind']}-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": LEARN_MODEL,
+                        "messages": [
+                            {"role": "system", "content": LEARN_PROMPT},
+                            {"role": "user", "content": json.dumps(event)}
+                        ]
+                    }
+                }
+                f.write(dumps(request) + b"\n")
+        
+        with batch_file.open("rb") as f:
+            uploaded = ai.files.create(file=f, purpose="batch")
+        batch = ai.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self._learn_batches.append(batch.id)
+    
+    def _collect_learning_batches(self):
+        """Save the output of finished learning batches"""
+        for batch_id in list(self._learn_batches):
+            batch = ai.batches.retrieve(batch_id)
+            if batch.status == "completed" and batch.output_file_id:
+                output = ai.files.content(batch.output_file_id)
+                (LEARN_DIR / f"{batch_id}.output.jsonl").write_bytes(output.content)
+            if batch.status in {"completed", "failed", "expired", "cancelled"}:
+                self._learn_batches.remove(batch_id)
+    
+    def _get_relevant_capabilities(self, prompt: str) -> set:
         """Get capabilities relevant to the user's prompt"""
-        capabilities = []
         prompt_lower = prompt.lower()
         
-        if any(word in prompt_lower for word in ["website", "clone", "scrape", "extract"]):
-            capabilities.append("website cloning")
-        
-        if any(word in prompt_lower for word in ["cloud", "deploy", "gcp", "google"]):
-            capabilities.append("google cloud")
-        
-        if any(word in prompt_lower for word in ["demo", "video", "record", "ad", "advertisement"]):
-            capabilities.append("demo creation")
-        
-        if any(word in prompt_lower for word in ["ios", "iphone", "swift", "xcode", "app store"]):
-            capabilities.append("iOS development")
-        
-        if any(word in prompt_lower for word in ["learn", "improve", "evolve", "capability"]):
-            capabilities.append("self-evolution")
+        if KEYWORD_AUTOMATON is not None:
+            capabilities = {label for _, label in KEYWORD_AUTOMATON.iter(prompt_lower)}
+        else:
+            capabilities = {
+                label for label, words in CAPABILITY_KEYWORDS.items()
+                if any(word in prompt_lower for word in words)
+            }
         
         # Always include core capabilities
-        capabilities.extend(["chat", "voice", "system commands"])
+        capabilities.update(CORE_CAPABILITIES)
         
-        return list(set(capabilities))
+        return capabilities
 
 # Global instance
 aiden = AidenSuperintelligence()
@@ -522,7 +871,7 @@ def main():
     console.print(Panel.fit(
         "[bold blue]🤖 Aiden Superintelligence[/bold blue]\n"
         "[cyan]The ultimate self-evolving AI assistant[/cyan]\n\n"
-        f"🚀 Loaded capabilities: {sum(sum(caps.values()) for caps in aiden.capabilities.values())}\n"
+        f"🚀 Loaded capabilities: {aiden._active_count}\n"
         "💬 Type 'help' for commands, 'voice' for voice mode, 'exit' to quit",
         style="bright_blue"
     ))
@@ -540,7 +889,7 @@ def main():
                     break
                 
                 elif user_input.lower() == 'voice':
-                    voice_mode()
+                    asyncio.run(voice_mode())
                     continue
                 
                 elif user_input.lower() == 'help':
@@ -548,12 +897,13 @@ def main():
                     continue
                 
                 # Check for advanced commands
-                if any(user_input.startswith(cmd) for cmd in ['clone ', 'gcloud ', 'deploy ', 'demo ', 'ios ', 'evolve ', '!host']):
+                if user_input.split(maxsplit=1)[0] in ADVANCED_VERBS:
                     response = aiden.execute_advanced_command(user_input)
+                    console.print(f"\n[bold green]Aiden[/bold green]: {response}")
                 else:
-                    response = aiden.think(user_input)
-                
-                console.print(f"\n[bold green]Aiden[/bold green]: {response}")
+                    console.print("\n[bold green]Aiden[/bold green]: ", end="")
+                    response = aiden.think(user_input, on_token=_print_token)
+                    console.print()
                 
                 if SPEAK_REPLIES:
                     aiden.speak(response)
@@ -566,42 +916,55 @@ def main():
     except KeyboardInterrupt:
         console.print("\n[green]👋 Goodbye![/green]")
 
-def voice_mode():
+async def voice_mode():
     """Enhanced voice interaction mode"""
     console.print(Panel("🎤 [bold]Voice Mode Active[/bold] - Press Enter to speak, 'q' to quit", style="green"))
     
+    # Playback of the previous reply runs in a worker thread while the next prompt is shown
+    playback = None
+    
     while True:
         try:
-            user_input = input("\nPress Enter to speak (or 'q' to quit): ").strip()
+            # Prompt from a worker thread so the previous reply plays while we wait
+            user_input = (await asyncio.to_thread(input, "\nPress Enter to speak (or 'q' to quit): ")).strip()
             if user_input.lower() == 'q':
                 break
             
-            audio_path = ROOT / "temp_recording.wav"
-            aiden.record(audio_path)
+            # Don't let the microphone pick up Aiden's own voice
+            if playback:
+                await playback
+                playback = None
+            await asyncio.to_thread(aiden.wait_for_speech)
+            
+            # The recording stays in memory and is uploaded straight from the buffer
+            audio = io.BytesIO()
+            await asyncio.to_thread(aiden.record, audio)
             
             console.print("[yellow]🤔 Transcribing...[/yellow]")
-            transcription = aiden.transcribe(audio_path)
+            transcription = await aiden.transcribe_async(audio)
             
             if transcription:
                 console.print(f"[cyan]You said:[/cyan] {transcription}")
                 
                 # Check for advanced commands
-                if any(transcription.startswith(cmd) for cmd in ['clone ', 'gcloud ', 'deploy ', 'demo ', 'ios ', 'evolve ']):
-                    response = aiden.execute_advanced_command(transcription)
+                if transcription.split(maxsplit=1)[0] in ADVANCED_VERBS:
+                    # Commands block until the background loop finishes them, so run them off this one
+                    response = await asyncio.to_thread(aiden.execute_advanced_command, transcription)
+                    console.print(f"[green]Aiden:[/green] {response}")
                 else:
-                    response = aiden.think(transcription)
+                    console.print("[green]Aiden:[/green] ", end="")
+                    response = await aiden.think_async(transcription, on_token=_print_token)
+                    console.print()
                 
-                console.print(f"[green]Aiden:[/green] {response}")
-                aiden.speak(response)
+                playback = asyncio.create_task(asyncio.to_thread(aiden.speak, response))
             else:
                 console.print("[red]No speech detected[/red]")
-            
-            # Clean up
-            if audio_path.exists():
-                audio_path.unlink()
         
         except KeyboardInterrupt:
             break
+    
+    if playback:
+        await playback
 
 def show_help():
     """Show enhanced help information"""
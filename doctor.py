@@ -4,15 +4,29 @@
 Validates all secrets, APIs, permissions, and system requirements.
 """
 
+import argparse
 import asyncio
+import importlib
 import os
 import sys
 import json
+import time
 import httpx
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# orjson serializes the report much faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add libs to path
 sys.path.append(str(Path(__file__).parent / "libs"))
 
@@ -25,58 +39,227 @@ except ImportError:
     CONNECTORS_AVAILABLE = False
     sys.exit(1)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+@lru_cache(maxsize=None)
+def _is_installed(module: str) -> bool:
+    """Check whether a module is importable without executing it"""
+    try:
+        return find_spec(module) is not None
+    except ModuleNotFoundError:  # parent package of a dotted name is missing
+        return False
+
+# Distribution names whose import name isn't just the name with '-' -> '_'
+DEP_MAP = {
+    "python-dotenv": "dotenv",
+    "google-cloud-storage": "google.cloud.storage",
+    "pinecone-client": "pinecone",
+}
+
+def _module_for(dep: str) -> str:
+    """Import name for a pip distribution name"""
+    return DEP_MAP.get(dep, dep.replace('-', '_'))
+
+# Where the web app's modules (superintelligence, main) live
+APP_DIR = "apps/replit-mvp"
+
+def _import_app_module(name: str):
+    """Import a module from the web app directory"""
+    if APP_DIR not in sys.path:
+        sys.path.append(APP_DIR)
+    return importlib.import_module(name)
+
+# Secrets reported by the doctor: (attribute, description, critical)
+SECRET_TABLE = (
+    ('openai_api_key', 'OpenAI API (Required for core AI)', True),
+    ('supabase_url', 'Supabase URL (Required for memory)', True),
+    ('supabase_service_role_key', 'Supabase Service Key (Required for memory)', True),
+    ('anthropic_api_key', 'Anthropic Claude API', False),
+    ('elevenlabs_api_key', 'ElevenLabs TTS API', False),
+    ('gcp_project_id', 'Google Cloud Platform', False),
+    ('pinecone_api_key', 'Pinecone Vector Database', False),
+)
+
+# Upper bound for any single external call, so one stalled service can't hang the doctor
+CHECK_TIMEOUT = 5
+CONNECTORS_TIMEOUT = 15
+
+# Checks that call out to remote (and possibly paid) services; skipped with --offline
+NETWORK_CHECKS = frozenset({
+    "openai_api",
+    "anthropic_api",
+    "elevenlabs_api",
+    "supabase_connection",
+    "google_cloud",
+    "unified_connectors",
+})
+
+# Output and results of the check running in the current task; concurrent checks
+# each fill their own section, and sections are merged in a fixed order afterwards.
+_current_section: ContextVar[Optional[Dict[str, list]]] = ContextVar("current_section", default=None)
+
+@dataclass(slots=True)
 class HealthCheck:
     """Individual health check result"""
-    def __init__(self, name: str, status: str, message: str, details: Optional[Dict] = None):
-        self.name = name
-        self.status = status  # ✅, ❌, ⚠️ 
-        self.message = message
-        self.details = details or {}
-        self.timestamp = datetime.now().isoformat()
+    name: str
+    status: str  # ✅, ❌, ⚠️
+    message: str
+    details: Dict = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    elapsed_ms: float = 0.0  # since the doctor run started
+
+class ReportEncoder(json.JSONEncoder):
+    """Stdlib JSON encoder for the report, without asdict's deep copy of each check"""
+    
+    def default(self, o):
+        if isinstance(o, HealthCheck):
+            return {name: getattr(o, name) for name in o.__slots__}
+        return super().default(o)
 
 class AidenDoctor:
     """Comprehensive Aiden system health checker"""
     
-    def __init__(self):
+    def __init__(self, args: Optional[argparse.Namespace] = None):
         self.checks: List[HealthCheck] = []
         self.secrets = secrets_manager.secrets
-    
-    async def run_all_checks(self) -> Dict[str, Any]:
-        """Run all health checks and return results"""
-        print("🩺 AIDEN DOCTOR - Starting comprehensive health check...\n")
         
-        # Core system checks
-        await self._check_secrets()
-        await self._check_file_permissions()
-        await self._check_python_environment()
+        # Check selection from the command line (everything by default)
+        self.offline = getattr(args, "offline", False)
+        self.only = getattr(args, "only", None)
+        
+        # Checks share the run's wall-clock timestamp and record a cheap monotonic offset
+        self._run_ts = datetime.now().isoformat()
+        self._run_t0 = time.perf_counter()
         
-        # API connectivity checks
-        await self._check_openai_api()
-        await self._check_anthropic_api()
-        await self._check_elevenlabs_api()
-        await self._check_supabase_connection()
-        await self._check_google_cloud()
+        # Output lines waiting to be written; flushed once per phase rather than per line
+        self._out: List[str] = []
         
-        # Service checks
-        await self._check_enhanced_aiden()
-        await self._check_web_server()
+        # One pooled client for every HTTP probe, so connections are reused across checks
+        self._http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(5.0, connect=3.0),
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._http.aclose()
+    
+    async def run_all_checks(self) -> Dict[str, Any]:
+        """Run all health checks and return results"""
+        self._log("🩺 AIDEN DOCTOR - Starting comprehensive health check...\n")
+        if self.offline:
+            self._log("📴 Offline mode - skipping API and service connectivity checks")
+        
+        # Core system checks (local, independent of each other)
+        await self._run_concurrently([
+            self._check_secrets,
+            self._check_file_permissions,
+            self._check_python_environment,
+        ])
+        
+        # API connectivity and service checks are network-bound, so overlap them
+        network_checks = [
+            self._check_openai_api,
+            self._check_anthropic_api,
+            self._check_elevenlabs_api,
+            self._check_supabase_connection,
+            self._check_google_cloud,
+            self._check_enhanced_aiden,
+            self._check_web_server,
+        ]
         
         # Unified connector checks
         if CONNECTORS_AVAILABLE:
-            await self._check_unified_connectors()
+            network_checks.append(self._check_unified_connectors)
+        
+        await self._run_concurrently(network_checks)
         
         # Generate report
         return self._generate_report()
     
+    def _selected(self, checks: List) -> List:
+        """Filter checks by the --offline and --only options"""
+        selected = []
+        for check in checks:
+            name = check.__name__.removeprefix("_check_")
+            if self.offline and name in NETWORK_CHECKS:
+                continue
+            if self.only and not any(name.startswith(prefix) for prefix in self.only):
+                continue
+            selected.append(check)
+        return selected
+    
+    async def _run_concurrently(self, checks: List) -> None:
+        """Run the selected checks concurrently, then record their results in list order"""
+        checks = self._selected(checks)
+        
+        # Structured concurrency: no check task outlives the phase, even if the run is cancelled
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._run_section(check)) for check in checks]
+        sections = [task.result() for task in tasks]
+        
+        for section in sections:
+            self.checks.extend(section["checks"])
+            self._out.extend(section["lines"])
+        self._flush()
+    
+    async def _run_section(self, check) -> Dict[str, list]:
+        """Run one check, collecting its output instead of printing it"""
+        section = {"lines": [], "checks": []}
+        _current_section.set(section)
+        
+        try:
+            await check()
+        except Exception as e:
+            # A crashing check is reported, not allowed to cancel its siblings
+            name = check.__name__.replace("_check_", "").replace("_", " ").title()
+            self._add_check(name, "❌", f"Check crashed: {str(e)}")
+        
+        return section
+    
+    async def _timed(self, name: str, coro, seconds: float = CHECK_TIMEOUT):
+        """Await an external call, recording a warning and returning None if it times out"""
+        try:
+            async with asyncio.timeout(seconds):
+                return await coro
+        except TimeoutError:
+            self._add_check(name, "⚠️", f"Timed out after {seconds}s")
+            return None
+    
+    def _log(self, line: str):
+        """Buffer a line of output, in the current check's section if there is one"""
+        section = _current_section.get()
+        if section is None:
+            self._out.append(line)
+        else:
+            section["lines"].append(line)
+    
+    def _flush(self):
+        """Write buffered output in a single call"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
+    
     def _add_check(self, name: str, status: str, message: str, details: Optional[Dict] = None):
         """Add a health check result"""
-        check = HealthCheck(name, status, message, details)
-        self.checks.append(check)
-        print(f"{status} {name}: {message}")
+        check = HealthCheck(
+            name, status, message, details or {},
+            timestamp=self._run_ts,
+            elapsed_ms=(time.perf_counter() - self._run_t0) * 1000
+        )
+        section = _current_section.get()
+        if section is None:
+            self.checks.append(check)
+        else:
+            section["checks"].append(check)
+        self._log(f"{status} {name}: {message}")
     
     async def _check_secrets(self):
         """Validate secrets configuration"""
-        print("🔐 Checking secrets configuration...")
+        self._log("🔐 Checking secrets configuration...")
         
         if not self.secrets:
             self._add_check("Secrets Schema", "❌", "Failed to load secrets from .env.local")
@@ -84,37 +267,21 @@ class AidenDoctor:
         
         self._add_check("Secrets Schema", "✅", "Secrets loaded and validated successfully")
         
-        # Check critical secrets
-        critical_secrets = {
-            'openai_api_key': 'OpenAI API (Required for core AI)',
-            'supabase_url': 'Supabase URL (Required for memory)',
-            'supabase_service_role_key': 'Supabase Service Key (Required for memory)',
-        }
-        
-        for secret_key, description in critical_secrets.items():
-            value = getattr(self.secrets, secret_key, None)
-            if value:
-                self._add_check(f"Secret: {secret_key}", "✅", description)
-            else:
-                self._add_check(f"Secret: {secret_key}", "⚠️", f"Optional: {description}")
-        
-        # Check optional but valuable secrets
-        optional_secrets = {
-            'anthropic_api_key': 'Anthropic Claude API',
-            'elevenlabs_api_key': 'ElevenLabs TTS API',
-            'gcp_project_id': 'Google Cloud Platform',
-            'pinecone_api_key': 'Pinecone Vector Database',
-        }
-        
-        for secret_key, description in optional_secrets.items():
-            value = getattr(self.secrets, secret_key, None)
+        # Check critical and optional-but-valuable secrets in one walk
+        values = vars(self.secrets)
+        for secret_key, description, critical in SECRET_TABLE:
+            value = values.get(secret_key)
             status = "✅" if value else "⚠️"
-            message = f"{description} - {'Configured' if value else 'Not configured'}"
-            self._add_check(f"Optional: {secret_key}", status, message)
+            if critical:
+                message = description if value else f"Optional: {description}"
+                self._add_check(f"Secret: {secret_key}", status, message)
+            else:
+                message = f"{description} - {'Configured' if value else 'Not configured'}"
+                self._add_check(f"Optional: {secret_key}", status, message)
     
     async def _check_file_permissions(self):
         """Check file system permissions"""
-        print("\n📁 Checking file system permissions...")
+        self._log("\n📁 Checking file system permissions...")
         
         # Check write permissions for key directories
         directories_to_check = [
@@ -124,21 +291,6 @@ class AidenDoctor:
             "ops/artifacts"
         ]
         
-        for dir_path in directories_to_check:
-            full_path = Path(dir_path)
-            try:
-                # Create directory if it doesn't exist
-                full_path.mkdir(parents=True, exist_ok=True)
-                
-                # Test write permission
-                test_file = full_path / "test_write_permission.txt"
-                test_file.write_text("test")
-                test_file.unlink()
-                
-                self._add_check(f"Directory: {dir_path}", "✅", "Write permissions OK")
-            except Exception as e:
-                self._add_check(f"Directory: {dir_path}", "❌", f"Permission error: {str(e)}")
-        
         # Check read permissions for key files
         files_to_check = [
             "apps/replit-mvp/main.py",
@@ -146,27 +298,55 @@ class AidenDoctor:
             ".env.example",
         ]
         
-        for file_path in files_to_check:
-            full_path = Path(file_path)
-            if full_path.exists():
-                try:
-                    full_path.read_text()
-                    self._add_check(f"File: {file_path}", "✅", "Read permissions OK")
-                except Exception as e:
-                    self._add_check(f"File: {file_path}", "❌", f"Read error: {str(e)}")
-            else:
-                self._add_check(f"File: {file_path}", "❌", "File does not exist")
+        # The probes are blocking syscalls, so overlap them in worker threads
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._probe_dir, dir_path) for dir_path in directories_to_check),
+            *(asyncio.to_thread(self._probe_file, file_path) for file_path in files_to_check)
+        )
+        
+        for name, status, message in results:
+            self._add_check(name, status, message)
+    
+    @staticmethod
+    def _probe_dir(dir_path: str) -> tuple:
+        """Check that a directory exists (creating it if needed) and is writable"""
+        full_path = Path(dir_path)
+        try:
+            # Create directory if it doesn't exist
+            full_path.mkdir(parents=True, exist_ok=True)
+            
+            # Test write permission
+            test_file = full_path / "test_write_permission.txt"
+            test_file.write_text("test")
+            test_file.unlink()
+            
+            return f"Directory: {dir_path}", "✅", "Write permissions OK"
+        except Exception as e:
+            return f"Directory: {dir_path}", "❌", f"Permission error: {str(e)}"
+    
+    @staticmethod
+    def _probe_file(file_path: str) -> tuple:
+        """Check that a file exists and is readable"""
+        full_path = Path(file_path)
+        if not full_path.exists():
+            return f"File: {file_path}", "❌", "File does not exist"
+        
+        # A permission probe doesn't need the file's contents
+        if not os.access(full_path, os.R_OK):
+            return f"File: {file_path}", "❌", "Read error: not readable"
+        
+        return f"File: {file_path}", "✅", "Read permissions OK"
     
     async def _check_python_environment(self):
         """Check Python environment and dependencies"""
-        print("\n🐍 Checking Python environment...")
+        self._log("\n🐍 Checking Python environment...")
         
         # Check Python version
         python_version = sys.version.split()[0]
-        if sys.version_info >= (3, 9):
+        if sys.version_info >= (3, 11):
             self._add_check("Python Version", "✅", f"Python {python_version} (OK)")
         else:
-            self._add_check("Python Version", "❌", f"Python {python_version} (Requires 3.9+)")
+            self._add_check("Python Version", "❌", f"Python {python_version} (Requires 3.11+)")
         
         # Check critical dependencies
         critical_deps = [
@@ -178,11 +358,11 @@ class AidenDoctor:
             'python-dotenv'
         ]
         
+        # find_spec locates packages without importing them (and their whole import graph)
         for dep in critical_deps:
-            try:
-                __import__(dep.replace('-', '_'))
+            if _is_installed(_module_for(dep)):
                 self._add_check(f"Dependency: {dep}", "✅", "Installed")
-            except ImportError:
+            else:
                 self._add_check(f"Dependency: {dep}", "❌", "Not installed")
         
         # Check optional dependencies
@@ -195,166 +375,178 @@ class AidenDoctor:
         ]
         
         # Check browser automation specifically
-        try:
-            import playwright
-            from playwright.async_api import async_playwright
+        if _is_installed("playwright.async_api"):
             self._add_check("Browser Automation", "✅", "Playwright installed and ready")
-        except ImportError:
+        else:
             self._add_check("Browser Automation", "⚠️", "Playwright not installed (optional for web automation)")
         
         # Check Mac system control
         import platform
         if platform.system() == "Darwin":
-            try:
-                # Check if osascript is available
-                import subprocess
-                subprocess.run(["osascript", "-e", "1 + 1"], 
-                             capture_output=True, check=True, timeout=5)
+            # Check if osascript is available (a stat, not a fork+exec with a 5s timeout)
+            if os.access("/usr/bin/osascript", os.X_OK):
                 self._add_check("Mac System Control", "✅", "AppleScript/JXA automation ready")
-            except:
+            else:
                 self._add_check("Mac System Control", "⚠️", "AppleScript not available on this macOS system")
         else:
             self._add_check("Mac System Control", "⚠️", f"Mac control requires macOS (running {platform.system()})")
         
         for dep in optional_deps:
-            try:
-                __import__(dep.replace('-', '_').replace('google_cloud_storage', 'google.cloud.storage'))
+            if _is_installed(_module_for(dep)):
                 self._add_check(f"Optional: {dep}", "✅", "Installed")
-            except ImportError:
+            else:
                 self._add_check(f"Optional: {dep}", "⚠️", "Not installed (optional)")
     
     async def _check_openai_api(self):
         """Test OpenAI API connectivity"""
-        print("\n🤖 Checking OpenAI API...")
+        self._log("\n🤖 Checking OpenAI API...")
         
         if not self.secrets.openai_api_key:
             self._add_check("OpenAI API", "❌", "API key not configured")
             return
         
         try:
-            import openai
-            client = openai.AsyncOpenAI(api_key=self.secrets.openai_api_key)
+            # Listing models validates the key without a billed completion
+            response = await self._timed("OpenAI API", self._http.get(
+                "https://api.openai.com/v1/models",
+                headers={"Authorization": f"Bearer {self.secrets.openai_api_key}"}
+            ))
+            if response is None:
+                return
             
-            # Test with minimal API call
-            response = await client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": "Test"}],
-                max_tokens=5
-            )
-            
-            self._add_check("OpenAI API", "✅", "Connection successful")
+            if response.status_code == 200:
+                self._add_check("OpenAI API", "✅", "Connection successful")
+            else:
+                self._add_check("OpenAI API", "❌", f"API error: {response.status_code}")
         except Exception as e:
             self._add_check("OpenAI API", "❌", f"Connection failed: {str(e)}")
     
     async def _check_anthropic_api(self):
         """Test Anthropic API connectivity"""
-        print("\n🧠 Checking Anthropic API...")
+        self._log("\n🧠 Checking Anthropic API...")
         
         if not self.secrets.anthropic_api_key:
             self._add_check("Anthropic API", "⚠️", "API key not configured (optional)")
             return
         
         try:
-            import anthropic
-            client = anthropic.AsyncAnthropic(api_key=self.secrets.anthropic_api_key)
-            
-            # Test with minimal API call
-            response = await client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=5,
-                messages=[{"role": "user", "content": "Test"}]
-            )
+            # Listing models validates the key without a billed message
+            response = await self._timed("Anthropic API", self._http.get(
+                "https://api.anthropic.com/v1/models",
+                headers={
+                    "x-api-key": self.secrets.anthropic_api_key,
+                    "anthropic-version": "2023-06-01"
+                }
+            ))
+            if response is None:
+                return
             
-            self._add_check("Anthropic API", "✅", "Connection successful")
-        except ImportError:
-            self._add_check("Anthropic API", "⚠️", "anthropic package not installed")
+            if response.status_code == 200:
+                self._add_check("Anthropic API", "✅", "Connection successful")
+            else:
+                self._add_check("Anthropic API", "❌", f"API error: {response.status_code}")
         except Exception as e:
             self._add_check("Anthropic API", "❌", f"Connection failed: {str(e)}")
     
     async def _check_elevenlabs_api(self):
         """Test ElevenLabs API connectivity"""
-        print("\n🔊 Checking ElevenLabs API...")
+        self._log("\n🔊 Checking ElevenLabs API...")
         
         if not self.secrets.elevenlabs_api_key:
             self._add_check("ElevenLabs API", "⚠️", "API key not configured (optional)")
             return
         
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {"xi-api-key": self.secrets.elevenlabs_api_key}
-                response = await client.get(
-                    "https://api.elevenlabs.io/v1/voices",
-                    headers=headers,
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    voices = response.json().get("voices", [])
-                    self._add_check("ElevenLabs API", "✅", f"Connection successful ({len(voices)} voices)")
-                else:
-                    self._add_check("ElevenLabs API", "❌", f"API error: {response.status_code}")
+            headers = {"xi-api-key": self.secrets.elevenlabs_api_key}
+            
+            async def probe():
+                # /voices is GET-only; stream it and close after the status line, so the
+                # auth question is answered without downloading the full voice list
+                async with self._http.stream(
+                    "GET", "https://api.elevenlabs.io/v1/voices", headers=headers
+                ) as response:
+                    return response.status_code
+            
+            status_code = await self._timed("ElevenLabs API", probe())
+            if status_code is None:
+                return
+            
+            if status_code == 200:
+                self._add_check("ElevenLabs API", "✅", "Connection successful")
+            elif status_code in (401, 403):
+                self._add_check("ElevenLabs API", "❌", f"API key rejected: {status_code}")
+            else:
+                self._add_check("ElevenLabs API", "⚠️", f"Reachable, unexpected status: {status_code}")
         except Exception as e:
             self._add_check("ElevenLabs API", "❌", f"Connection failed: {str(e)}")
     
     async def _check_supabase_connection(self):
         """Test Supabase connectivity"""
-        print("\n🗄️ Checking Supabase connection...")
+        self._log("\n🗄️ Checking Supabase connection...")
         
         if not (self.secrets.supabase_url and self.secrets.supabase_service_role_key):
             self._add_check("Supabase", "❌", "URL or service key not configured")
             return
         
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "apikey": self.secrets.supabase_service_role_key,
-                    "Authorization": f"Bearer {self.secrets.supabase_service_role_key}"
-                }
-                
-                # Test connection with a simple query
-                response = await client.get(
-                    f"{self.secrets.supabase_url}/rest/v1/",
-                    headers=headers,
-                    timeout=10
-                )
-                
-                if response.status_code in [200, 404]:  # 404 is OK for root endpoint
-                    self._add_check("Supabase", "✅", "Connection successful")
-                else:
-                    self._add_check("Supabase", "❌", f"Connection error: {response.status_code}")
+            headers = {
+                "apikey": self.secrets.supabase_service_role_key,
+                "Authorization": f"Bearer {self.secrets.supabase_service_role_key}"
+            }
+            
+            # Test connection with a bodiless request to the REST root
+            response = await self._timed("Supabase", self._http.head(
+                f"{self.secrets.supabase_url}/rest/v1/",
+                headers=headers
+            ))
+            if response is None:
+                return
+            
+            if response.status_code in [200, 404]:  # 404 is OK for root endpoint
+                self._add_check("Supabase", "✅", "Connection successful")
+            else:
+                self._add_check("Supabase", "❌", f"Connection error: {response.status_code}")
         except Exception as e:
             self._add_check("Supabase", "❌", f"Connection failed: {str(e)}")
     
     async def _check_google_cloud(self):
         """Test Google Cloud connectivity"""
-        print("\n☁️ Checking Google Cloud...")
+        self._log("\n☁️ Checking Google Cloud...")
         
         if not self.secrets.gcp_project_id:
             self._add_check("Google Cloud", "⚠️", "Project ID not configured (optional)")
             return
         
+        # Skip the SDK import (and its dependency graph) when the package isn't there
+        if not _is_installed(_module_for("google-cloud-storage")):
+            self._add_check("Google Cloud", "⚠️", "google-cloud-storage package not installed")
+            return
+        
         try:
             from google.cloud import storage
             
-            # Try to initialize client
-            client = storage.Client()
+            def list_one_bucket():
+                # Try to initialize client, then test with a simple operation
+                client = storage.Client()
+                return list(client.list_buckets(max_results=1))
             
-            # Test with a simple operation
-            buckets = list(client.list_buckets(max_results=1))
+            # The storage client is synchronous, so run it off the event loop
+            buckets = await self._timed("Google Cloud", asyncio.to_thread(list_one_bucket))
+            if buckets is None:
+                return
             self._add_check("Google Cloud", "✅", f"Connection successful (Project: {self.secrets.gcp_project_id})")
-        except ImportError:
-            self._add_check("Google Cloud", "⚠️", "google-cloud-storage package not installed")
         except Exception as e:
             self._add_check("Google Cloud", "❌", f"Connection failed: {str(e)}")
     
     async def _check_enhanced_aiden(self):
         """Test Enhanced Aiden core functionality"""
-        print("\n🧠 Checking Enhanced Aiden core...")
+        self._log("\n🧠 Checking Enhanced Aiden core...")
         
         try:
-            # Import Enhanced Aiden
-            sys.path.append("apps/replit-mvp")
-            from superintelligence import AIDEN_SUPERINTELLIGENCE_ENHANCED
+            # Import Enhanced Aiden (in a thread: the heavy import would otherwise stall the
+            # event loop while the concurrent network probes' timeouts keep running)
+            superintelligence = await asyncio.to_thread(_import_app_module, "superintelligence")
+            superintelligence.AIDEN_SUPERINTELLIGENCE_ENHANCED  # AttributeError if the core object is missing
             
             self._add_check("Enhanced Aiden Import", "✅", "Core module imported successfully")
             
@@ -365,12 +557,11 @@ class AidenDoctor:
     
     async def _check_web_server(self):
         """Test web server functionality"""
-        print("\n🌐 Checking web server...")
+        self._log("\n🌐 Checking web server...")
         
         try:
-            # Check if main.py can be imported
-            sys.path.append("apps/replit-mvp")
-            import main
+            # Check if main.py can be imported (off the event loop, like the core import)
+            main = await asyncio.to_thread(_import_app_module, "main")
             
             self._add_check("FastAPI Server", "✅", "Main server module loaded")
             
@@ -382,11 +573,15 @@ class AidenDoctor:
     
     async def _check_unified_connectors(self):
         """Test unified connector layer"""
-        print("\n🔌 Checking unified connector layer...")
+        self._log("\n🔌 Checking unified connector layer...")
         
         try:
             # Test all connectors
-            connector_results = await health_check_all_connectors()
+            connector_results = await self._timed(
+                "Unified Connector System", health_check_all_connectors(), seconds=CONNECTORS_TIMEOUT
+            )
+            if connector_results is None:
+                return
             
             for connector_name, result in connector_results.items():
                 if result.success:
@@ -414,14 +609,22 @@ class AidenDoctor:
     
     def _generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive health report"""
-        print("\n" + "="*60)
-        print("🩺 AIDEN DOCTOR REPORT")
-        print("="*60)
-        
-        # Count statuses
-        passed = len([c for c in self.checks if c.status == "✅"])
-        warned = len([c for c in self.checks if c.status == "⚠️"])
-        failed = len([c for c in self.checks if c.status == "❌"])
+        self._log("\n" + "="*60)
+        self._log("🩺 AIDEN DOCTOR REPORT")
+        self._log("="*60)
+        self._flush()
+        
+        # Count statuses and collect failures/warnings in one pass
+        counts = Counter()
+        by_status = {"❌": [], "⚠️": []}
+        for check in self.checks:
+            counts[check.status] += 1
+            if check.status in by_status:
+                by_status[check.status].append(check)
+        
+        passed = counts["✅"]
+        warned = counts["⚠️"]
+        failed = counts["❌"]
         total = len(self.checks)
         
         # Overall status
@@ -434,48 +637,47 @@ class AidenDoctor:
         else:
             overall_status = f"🔴 CRITICAL - {failed} critical issues require immediate attention"
         
-        print(f"\nOVERALL STATUS: {overall_status}")
-        print(f"RESULTS: {passed} passed, {warned} warnings, {failed} failed ({total} total)")
+        self._log(f"\nOVERALL STATUS: {overall_status}")
+        self._log(f"RESULTS: {passed} passed, {warned} warnings, {failed} failed ({total} total)")
         
         # Show failed checks
         if failed > 0:
-            print(f"\n❌ CRITICAL ISSUES ({failed}):")
-            for check in self.checks:
-                if check.status == "❌":
-                    print(f"  • {check.name}: {check.message}")
+            self._log(f"\n❌ CRITICAL ISSUES ({failed}):")
+            for check in by_status["❌"]:
+                self._log(f"  • {check.name}: {check.message}")
         
         # Show warnings
         if warned > 0:
-            print(f"\n⚠️ WARNINGS ({warned}):")
-            for check in self.checks:
-                if check.status == "⚠️":
-                    print(f"  • {check.name}: {check.message}")
+            self._log(f"\n⚠️ WARNINGS ({warned}):")
+            for check in by_status["⚠️"]:
+                self._log(f"  • {check.name}: {check.message}")
         
         # Recommendations
-        print(f"\n💡 RECOMMENDATIONS:")
+        self._log(f"\n💡 RECOMMENDATIONS:")
         if failed > 0:
-            print("  • Fix critical issues before deploying Enhanced Aiden")
-            print("  • Ensure all API keys are properly configured")
-            print("  • Verify file permissions and dependencies")
+            self._log("  • Fix critical issues before deploying Enhanced Aiden")
+            self._log("  • Ensure all API keys are properly configured")
+            self._log("  • Verify file permissions and dependencies")
         
         if warned > 0:
-            print("  • Consider configuring optional services for full functionality")
-            print("  • ElevenLabs API for voice capabilities")
-            print("  • Google Cloud for advanced deployment options")
+            self._log("  • Consider configuring optional services for full functionality")
+            self._log("  • ElevenLabs API for voice capabilities")
+            self._log("  • Google Cloud for advanced deployment options")
         
-        print("  • Run `make doctor` regularly to monitor system health")
-        print("  • Keep all API keys secure and rotate regularly")
+        self._log("  • Run `make doctor` regularly to monitor system health")
+        self._log("  • Keep all API keys secure and rotate regularly")
         
         # Next steps
         if failed == 0:
-            print(f"\n🚀 NEXT STEPS:")
-            print("  • Enhanced Aiden is ready for operation!")
-            print("  • Start with: cd apps/replit-mvp && python -m uvicorn main:app --port 8001")
-            print("  • Test with: curl -X POST -H 'Content-Type: application/json' \\")
-            print("              -d '{\"message\":\"Build me a website\",\"account_id\":\"test\"}' \\")
-            print("              http://localhost:8001/api/chat")
+            self._log(f"\n🚀 NEXT STEPS:")
+            self._log("  • Enhanced Aiden is ready for operation!")
+            self._log("  • Start with: cd apps/replit-mvp && python -m uvicorn main:app --port 8001")
+            self._log("  • Test with: curl -X POST -H 'Content-Type: application/json' \\")
+            self._log("              -d '{\"message\":\"Build me a website\",\"account_id\":\"test\"}' \\")
+            self._log("              http://localhost:8001/api/chat")
         
-        print("="*60)
+        self._log("="*60)
+        self._flush()
         
         # Return structured report
         return {
@@ -487,31 +689,37 @@ class AidenDoctor:
                 "warnings": warned,
                 "failed": failed
             },
-            "checks": [
-                {
-                    "name": check.name,
-                    "status": check.status,
-                    "message": check.message,
-                    "details": check.details,
-                    "timestamp": check.timestamp
-                }
-                for check in self.checks
-            ],
+            "checks": self.checks,  # serialized straight from the dataclasses when saved
             "secrets_summary": secrets_manager.get_masked_summary(),
             "ready_for_production": failed == 0
         }
 
 async def main():
     """Run Aiden Doctor health check"""
-    doctor = AidenDoctor()
-    report = await doctor.run_all_checks()
+    parser = argparse.ArgumentParser(description="Aiden system health check")
+    parser.add_argument("--offline", action="store_true",
+                        help="skip checks that call external APIs and services")
+    parser.add_argument("--only", type=lambda s: set(s.split(",")),
+                        help="comma-separated checks to run, e.g. secrets,openai,supabase")
+    args = parser.parse_args()
+    
+    doctor = AidenDoctor(args)
+    try:
+        report = await doctor.run_all_checks()
+    finally:
+        await doctor.aclose()
     
     # Save report to file
     report_path = Path("logs/doctor_report.json")
     report_path.parent.mkdir(exist_ok=True)
     
-    with open(report_path, "w") as f:
-        json.dump(report, f, indent=2)
+    # orjson encodes the HealthCheck dataclasses natively; the stdlib fallback
+    # converts them one at a time and streams the encoder's chunks to the file
+    if orjson:
+        report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2, cls=ReportEncoder)
     
     print(f"\nDetailed report saved to: {report_path}")
     
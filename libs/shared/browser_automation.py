@@ -6,7 +6,12 @@ Advanced web automation for intelligent browsing and data extraction.
 import asyncio
 import json
 import tempfile
+import time
 import base64
+import hashlib
+import itertools
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -25,7 +30,121 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
-@dataclass
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
+# Context settings shared by every launch: a desktop viewport and a realistic user agent
+DEFAULT_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+
+# Requests that scraping never needs: heavy media, and analytics beacons that hold up page loads
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "mixpanel.com",
+)
+
+
+async def _route_resource_filter(target, resource_types=BLOCKED_RESOURCE_TYPES, blocked_hosts=BLOCKED_HOSTS):
+    """Abort matching requests on a page or context before they are sent"""
+    blocked_hosts = tuple(blocked_hosts)
+    
+    async def handle(route):
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if request.resource_type in resource_types or host.endswith(blocked_hosts):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    await target.route("**/*", handle)
+
+
+# What Playwright reports for a context with no cookies or local storage
+EMPTY_STORAGE_STATE = {"cookies": [], "origins": []}
+
+
+# Screenshot names: process start time plus a counter, unique even within the same second
+_SCREENSHOT_RUN = int(time.time())
+_SCREENSHOT_SEQ = itertools.count()
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(directory: str) -> None:
+    """Create a directory once per process, skipping the mkdir syscall on repeat writes"""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+
+# Reads the trimmed text of each selector's first match (null when absent) in one evaluate
+EXTRACT_SCRIPT = """(selectors) => {
+    const out = {};
+    for (const [key, selector] of Object.entries(selectors)) {
+        const element = document.querySelector(selector);
+        out[key] = element ? element.innerText.trim() : null;
+    }
+    return out;
+}"""
+
+
+PAGE_SUMMARY_SCRIPT = "() => [document.title, document.documentElement.outerHTML.length]"
+
+# Sets every field's value in one evaluate; returns whether each selector matched
+FILL_SCRIPT = """([entries, dispatch]) => entries.map(([selector, value]) => {
+    const element = document.querySelector(selector);
+    if (!element) return false;
+    element.value = value;
+    if (dispatch) {
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+    }
+    return true;
+})"""
+
+# Resolves true as soon as a mutation makes a match for the selector visible (false after
+# timeout_ms); "visible" follows Playwright's rule of a non-empty box and no visibility:hidden
+MUTATION_WAIT_SCRIPT = """([selector, timeoutMs, waitId]) => new Promise((resolve) => {
+    const visible = () => {
+        const element = document.querySelector(selector);
+        return !!element && element.getClientRects().length > 0
+            && getComputedStyle(element).visibility !== "hidden";
+    };
+    if (visible()) return resolve(true);
+    const waits = window.__aidenWaits ??= {};
+    const finish = (found) => {
+        observer.disconnect();
+        clearTimeout(timer);
+        delete waits[waitId];
+        resolve(found);
+    };
+    const observer = new MutationObserver(() => { if (visible()) finish(true); });
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    const timer = setTimeout(() => finish(false), timeoutMs);
+    waits[waitId] = () => finish(false);
+})"""
+
+# Disconnects a MUTATION_WAIT_SCRIPT observer that lost the race
+CANCEL_WAIT_SCRIPT = "(waitId) => window.__aidenWaits?.[waitId]?.()"
+
+SELECTOR_VISIBLE_SCRIPT = """(selector) => {
+    const element = document.querySelector(selector);
+    return !!element && element.getClientRects().length > 0
+        && getComputedStyle(element).visibility !== "hidden";
+}"""
+
+# Distinguishes concurrent observer waits on the same page
+_WAIT_IDS = itertools.count()
+
+
+@dataclass(slots=True)
 class BrowserResponse:
     """Standardized response for browser operations"""
     success: bool
@@ -46,16 +165,33 @@ class AidenBrowserAutomation:
         self.context = None
         self.page = None
         self.default_timeout = 30000  # 30 seconds
+        self.storage_state_path = None
+        
+        # Page-side functions already bound to their arguments, by script+args hash. Only
+        # pages this instance owns and keeps using compile them; for_page wrappers are one-shot
+        self._fn_cache: Dict[str, Any] = {}
+        self._fn_seen: set = set()
+        self._reuse_functions = False
+        
+    async def initialize(
+        self,
+        headless: bool = True,
+        browser_type: str = "chromium",
+        context_options: Optional[Dict[str, Any]] = None,
+        storage_state_path: Optional[str] = None
+    ) -> BrowserResponse:
+        """Initialize browser automation system
         
-    async def initialize(self, headless: bool = True, browser_type: str = "chromium") -> BrowserResponse:
-        """Initialize browser automation system"""
-        start_time = asyncio.get_event_loop().time()
+        With storage_state_path, cookies and local storage saved by an earlier close()
+        are restored, so logged-in sessions survive between runs.
+        """
+        start_time = time.perf_counter_ns()
         
         if not PLAYWRIGHT_AVAILABLE:
             return BrowserResponse(
                 success=False,
                 error="Playwright not installed. Run: pip install playwright && playwright install",
-                execution_time_ms=(asyncio.get_event_loop().time() - start_time) * 1000
+                execution_time_ms=_elapsed_ms(start_time)
             )
         
         try:
@@ -69,17 +205,20 @@ class AidenBrowserAutomation:
             else:  # default to chromium
                 self.browser = await self.playwright.chromium.launch(headless=headless)
             
-            # Create context with realistic user agent
-            self.context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
+            # Create context with realistic user agent (or the caller's options)
+            options = context_options or DEFAULT_CONTEXT_OPTIONS
+            self.storage_state_path = storage_state_path
+            if storage_state_path and Path(storage_state_path).exists():
+                options = {**options, "storage_state": storage_state_path}
+            self.context = await self.browser.new_context(**options)
             
             # Create initial page
             self.page = await self.context.new_page()
             self.page.set_default_timeout(self.default_timeout)
+            await self._clear_fn_cache()
+            self._reuse_functions = True
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -89,16 +228,21 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
-    async def navigate_to(self, url: str, wait_for: Optional[str] = None) -> BrowserResponse:
-        """Navigate to a URL"""
-        start_time = asyncio.get_event_loop().time()
+    async def navigate_to(
+        self,
+        url: str,
+        wait_for: Optional[str] = None,
+        wait_until: str = "domcontentloaded"
+    ) -> BrowserResponse:
+        """Navigate to a URL, optionally gating on a selector instead of network idle"""
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -108,8 +252,9 @@ class AidenBrowserAutomation:
             )
         
         try:
-            # Navigate to URL
-            response = await self.page.goto(url, wait_until="networkidle")
+            # Navigate to URL (the new document drops any compiled functions)
+            await self._clear_fn_cache()
+            response = await self.page.goto(url, wait_until=wait_until)
             
             # Wait for specific element if requested
             if wait_for:
@@ -119,7 +264,7 @@ class AidenBrowserAutomation:
             title = await self.page.title()
             current_url = self.page.url
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -132,7 +277,7 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
@@ -141,7 +286,7 @@ class AidenBrowserAutomation:
     
     async def extract_data(self, selectors: Dict[str, str]) -> BrowserResponse:
         """Extract data from page using CSS selectors"""
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -151,26 +296,16 @@ class AidenBrowserAutomation:
             )
         
         try:
-            extracted_data = {}
+            # Wait once for the page to render any of the selectors, not once per selector
+            try:
+                await self.page.wait_for_selector(", ".join(selectors.values()), timeout=5000)
+            except Exception:
+                pass  # none present yet; missing keys come back as None
             
-            for key, selector in selectors.items():
-                try:
-                    # Wait for element to be present
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    
-                    # Extract text content
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.inner_text()
-                        extracted_data[key] = text.strip()
-                    else:
-                        extracted_data[key] = None
-                        
-                except Exception:
-                    # Element not found or timeout
-                    extracted_data[key] = None
+            # Read every selector in a single round-trip to the browser
+            extracted_data = await self._evaluate_bound(EXTRACT_SCRIPT, selectors)
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -179,16 +314,26 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
-    async def take_screenshot(self, path: Optional[str] = None, full_page: bool = True) -> BrowserResponse:
-        """Take a screenshot of the current page"""
-        start_time = asyncio.get_event_loop().time()
+    async def take_screenshot(
+        self,
+        path: Optional[str] = None,
+        full_page: bool = False,
+        return_bytes: bool = False,
+        quality: int = 70
+    ) -> BrowserResponse:
+        """Take a screenshot of the current page (JPEG unless path asks for another format)
+        
+        Captures the viewport by default; pass full_page=True for the whole scroll height,
+        which makes the browser re-layout and composite the entire page.
+        """
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -198,16 +343,27 @@ class AidenBrowserAutomation:
             )
         
         try:
+            if return_bytes:
+                # Hand the image back inline without touching the disk
+                image = await self.page.screenshot(full_page=full_page, type="jpeg", quality=quality)
+                
+                return BrowserResponse(
+                    success=True,
+                    data={"b64": base64.b64encode(image).decode(), "bytes": len(image), "full_page": full_page},
+                    execution_time_ms=_elapsed_ms(start_time)
+                )
+            
             if not path:
-                path = f"logs/screenshot_{int(datetime.now().timestamp())}.png"
+                path = f"logs/screenshot_{_SCREENSHOT_RUN}_{next(_SCREENSHOT_SEQ):06d}.jpg"
             
             # Ensure directory exists
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(str(Path(path).parent))
             
-            # Take screenshot
-            await self.page.screenshot(path=path, full_page=full_page)
+            # Take screenshot (Playwright picks the format from the extension; quality is JPEG-only)
+            options = {"quality": quality} if path.lower().endswith((".jpg", ".jpeg")) else {}
+            await self.page.screenshot(path=path, full_page=full_page, **options)
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -217,7 +373,7 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
@@ -226,7 +382,7 @@ class AidenBrowserAutomation:
     
     async def fill_form(self, form_data: Dict[str, str]) -> BrowserResponse:
         """Fill out form fields"""
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -236,18 +392,13 @@ class AidenBrowserAutomation:
             )
         
         try:
-            filled_fields = {}
-            
-            for selector, value in form_data.items():
-                try:
-                    # Wait for field and fill it
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.fill(selector, value)
-                    filled_fields[selector] = "success"
-                except Exception as e:
-                    filled_fields[selector] = f"failed: {str(e)}"
+            # Fields are independent once the form renders, so overlap their round-trips
+            results = await asyncio.gather(
+                *(self._fill_one(selector, value) for selector, value in form_data.items())
+            )
+            filled_fields = dict(results)
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -256,16 +407,63 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
+    async def fill_form_fast(self, form_data: Dict[str, str], dispatch_events: bool = True) -> BrowserResponse:
+        """Fill out form fields in a single page script
+        
+        One round-trip for any number of fields, but without fill()'s actionability
+        checks: hidden, disabled or not-yet-rendered fields are set (or missed) as-is.
+        Use fill_form when the page may still be changing.
+        """
+        start_time = time.perf_counter_ns()
+        
+        if not self.page:
+            return BrowserResponse(
+                success=False,
+                error="Browser not initialized.",
+                execution_time_ms=0
+            )
+        
+        try:
+            entries = list(form_data.items())
+            matched = await self.page.evaluate(FILL_SCRIPT, [entries, dispatch_events])
+            
+            filled_fields = {
+                selector: "success" if found else "failed: element not found"
+                for (selector, _), found in zip(entries, matched)
+            }
+            
+            return BrowserResponse(
+                success=True,
+                data={"filled_fields": filled_fields},
+                execution_time_ms=_elapsed_ms(start_time)
+            )
+            
+        except Exception as e:
+            return BrowserResponse(
+                success=False,
+                error=str(e),
+                execution_time_ms=_elapsed_ms(start_time)
+            )
+    
+    async def _fill_one(self, selector: str, value: str) -> tuple:
+        """Fill one field, returning (selector, outcome) instead of raising"""
+        try:
+            # fill() waits for the field to be editable itself
+            await self.page.fill(selector, value, timeout=5000)
+            return selector, "success"
+        except Exception as e:
+            return selector, f"failed: {str(e)}"
+    
     async def click_element(self, selector: str, wait_for_navigation: bool = False) -> BrowserResponse:
         """Click an element on the page"""
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -275,17 +473,16 @@ class AidenBrowserAutomation:
             )
         
         try:
-            # Wait for element to be clickable
-            await self.page.wait_for_selector(selector)
-            
+            # click() waits for the element to be visible, stable and enabled itself
             if wait_for_navigation:
-                # Click and wait for navigation
+                # Click and wait for navigation, which invalidates every compiled function
+                await self._clear_fn_cache()
                 async with self.page.expect_navigation():
                     await self.page.click(selector)
             else:
                 await self.page.click(selector)
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -294,7 +491,7 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
@@ -303,7 +500,7 @@ class AidenBrowserAutomation:
     
     async def execute_javascript(self, script: str) -> BrowserResponse:
         """Execute JavaScript on the page"""
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -315,7 +512,7 @@ class AidenBrowserAutomation:
         try:
             result = await self.page.evaluate(script)
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -324,16 +521,21 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
-    async def wait_for_element(self, selector: str, timeout: int = 30000) -> BrowserResponse:
-        """Wait for an element to appear"""
-        start_time = asyncio.get_event_loop().time()
+    async def wait_for_element(
+        self,
+        selector: str,
+        timeout_ms: int = 30000,
+        poll_ms: Optional[int] = None
+    ) -> BrowserResponse:
+        """Wait for an element to appear, racing a DOM mutation observer against polling"""
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -343,9 +545,48 @@ class AidenBrowserAutomation:
             )
         
         try:
-            await self.page.wait_for_selector(selector, timeout=timeout)
+            # The observer fires on the mutation that reveals the element, with no polling at all;
+            # the poller (Playwright's own, or every poll_ms) covers anything the observer misses
+            if poll_ms:
+                poller = self.page.wait_for_function(
+                    SELECTOR_VISIBLE_SCRIPT, arg=selector, polling=poll_ms, timeout=timeout_ms
+                )
+            else:
+                poller = self.page.wait_for_selector(selector, timeout=timeout_ms)
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            wait_id = next(_WAIT_IDS)
+            observer = asyncio.ensure_future(
+                self.page.evaluate(MUTATION_WAIT_SCRIPT, [selector, timeout_ms, wait_id])
+            )
+            pending = {observer, asyncio.ensure_future(poller)}
+            found = False
+            errors = []
+            try:
+                while pending and not found:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception():
+                            errors.append(task.exception())
+                        elif task.result():
+                            found = True
+            finally:
+                for task in pending:
+                    task.cancel()
+                # Cancelling the evaluate leaves the observer running in the page until its timeout
+                if observer in pending:
+                    try:
+                        await self.page.evaluate(CANCEL_WAIT_SCRIPT, wait_id)
+                    except Exception:
+                        pass  # page navigated or closed, taking the observer with it
+            
+            execution_time = _elapsed_ms(start_time)
+            
+            if not found:
+                return BrowserResponse(
+                    success=False,
+                    error=str(errors[0]) if errors else f"Timeout {timeout_ms}ms waiting for {selector}",
+                    execution_time_ms=execution_time
+                )
             
             return BrowserResponse(
                 success=True,
@@ -354,16 +595,16 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
-    async def get_page_content(self) -> BrowserResponse:
-        """Get full page content (HTML)"""
-        start_time = asyncio.get_event_loop().time()
+    async def get_page_content(self, include_html: bool = False) -> BrowserResponse:
+        """Get page info, plus the full HTML only when include_html is set"""
+        start_time = time.perf_counter_ns()
         
         if not self.page:
             return BrowserResponse(
@@ -373,11 +614,22 @@ class AidenBrowserAutomation:
             )
         
         try:
+            url = self.page.url
+            
+            if not include_html:
+                # Measure the document in the page rather than shipping it over
+                title, length = await self.page.evaluate(PAGE_SUMMARY_SCRIPT)
+                
+                return BrowserResponse(
+                    success=True,
+                    data={"title": title, "url": url, "length": length},
+                    execution_time_ms=_elapsed_ms(start_time)
+                )
+            
             content = await self.page.content()
             title = await self.page.title()
-            url = self.page.url
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -391,7 +643,7 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
@@ -400,10 +652,17 @@ class AidenBrowserAutomation:
     
     async def close(self) -> BrowserResponse:
         """Close browser and clean up resources"""
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter_ns()
         
         try:
+            if self.page:
+                await self._clear_fn_cache()
+            
             if self.context:
+                if self.storage_state_path:
+                    # Persist the session for the next initialize()
+                    _ensure_dir(str(Path(self.storage_state_path).parent))
+                    await self.context.storage_state(path=self.storage_state_path)
                 await self.context.close()
             
             if self.browser:
@@ -412,7 +671,7 @@ class AidenBrowserAutomation:
             if self.playwright:
                 await self.playwright.stop()
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=True,
@@ -421,13 +680,87 @@ class AidenBrowserAutomation:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
+    async def set_resource_filter(
+        self,
+        resource_types=BLOCKED_RESOURCE_TYPES,
+        blocked_hosts=BLOCKED_HOSTS
+    ) -> BrowserResponse:
+        """Block images, fonts, media and analytics hosts for faster scraping"""
+        start_time = time.perf_counter_ns()
+        
+        target = self.context or self.page
+        if not target:
+            return BrowserResponse(
+                success=False,
+                error="Browser not initialized.",
+                execution_time_ms=0
+            )
+        
+        try:
+            await _route_resource_filter(target, resource_types, blocked_hosts)
+            
+            return BrowserResponse(
+                success=True,
+                data={"resource_types": sorted(resource_types), "blocked_hosts": list(blocked_hosts)},
+                execution_time_ms=_elapsed_ms(start_time)
+            )
+            
+        except Exception as e:
+            return BrowserResponse(
+                success=False,
+                error=str(e),
+                execution_time_ms=_elapsed_ms(start_time)
+            )
+    
+    async def _evaluate_bound(self, script: str, args: Any) -> Any:
+        """Evaluate script(args) in one round-trip, compiling it in the page once it repeats
+        
+        A first call evaluates directly. On a page this instance keeps using, the second
+        identical call compiles a bound function so later repeats send only its handle.
+        """
+        key = hashlib.blake2b(json.dumps([script, args], sort_keys=True).encode()).hexdigest()
+        
+        handle = self._fn_cache.get(key)
+        if handle is not None:
+            try:
+                return await handle.evaluate("fn => fn()")
+            except Exception:
+                # The page navigated since, taking its handles with it
+                await self._clear_fn_cache()
+        elif key in self._fn_seen:
+            handle = await self.page.evaluate_handle(f"(args) => () => ({script})(args)", args)
+            self._fn_cache[key] = handle
+            return await handle.evaluate("fn => fn()")
+        elif self._reuse_functions:
+            self._fn_seen.add(key)
+        
+        return await self.page.evaluate(script, args)
+    
+    async def _clear_fn_cache(self):
+        """Forget compiled functions, releasing their page-side handles"""
+        handles = list(self._fn_cache.values())
+        self._fn_cache.clear()
+        self._fn_seen.clear()
+        
+        if handles:
+            # Handles from a document that already navigated away fail to dispose; that is fine
+            await asyncio.gather(*(handle.dispose() for handle in handles), return_exceptions=True)
+    
+    @classmethod
+    def for_page(cls, page) -> "AidenBrowserAutomation":
+        """Wrap an already open page, e.g. one from a BrowserPool context"""
+        automation = cls()
+        automation.page = page
+        page.set_default_timeout(automation.default_timeout)
+        return automation
+    
     async def __aenter__(self):
         await self.initialize()
         return self
@@ -436,45 +769,193 @@ class AidenBrowserAutomation:
         await self.close()
 
 
+class BrowserPool:
+    """Shared browser with a pool of warm contexts, checked out per task"""
+    
+    def __init__(
+        self,
+        max_contexts: int = 8,
+        headless: bool = True,
+        browser_type: str = "chromium",
+        block_resources: bool = False,
+        context_options: Optional[Dict[str, Any]] = None,
+        storage_state_path: Optional[str] = None
+    ):
+        self.max_contexts = max_contexts
+        self.headless = headless
+        self.browser_type = browser_type
+        self.block_resources = block_resources
+        self.context_options = context_options or DEFAULT_CONTEXT_OPTIONS
+        self.storage_state_path = storage_state_path
+        self.playwright = None
+        self.browser = None
+        self._contexts: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # The shared session, bumped to a new version whenever a task changes it; contexts
+        # made from an older version are rebuilt from the current one on checkout
+        self._storage_state: Optional[Dict[str, Any]] = None
+        self._state_version = 0
+        self._context_versions: Dict[Any, int] = {}
+    
+    async def start(self):
+        """Launch the browser and pre-create its contexts (once per event loop)"""
+        # Playwright's connection, the queue and the lock all belong to the loop that made
+        # them; a module-level pool outlives asyncio.run(), so a new loop starts afresh
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._forget(loop)
+        
+        async with self._start_lock:
+            if self.browser:
+                return
+            
+            if not PLAYWRIGHT_AVAILABLE:
+                raise RuntimeError("Playwright not installed. Run: pip install playwright && playwright install")
+            
+            self.playwright = await async_playwright().start()
+            launcher = getattr(self.playwright, self.browser_type, self.playwright.chromium)
+            self.browser = await launcher.launch(headless=self.headless)
+            
+            # Read a saved session once and seed every context with it
+            if self.storage_state_path and Path(self.storage_state_path).exists():
+                self._storage_state = json.loads(Path(self.storage_state_path).read_text())
+            
+            self._contexts = asyncio.Queue()
+            contexts = await asyncio.gather(*(self._new_context() for _ in range(self.max_contexts)))
+            for context in contexts:
+                self._contexts.put_nowait(context)
+    
+    def _forget(self, loop: Optional[asyncio.AbstractEventLoop]):
+        """Drop a browser left behind by a finished event loop (it closed along with that loop)"""
+        self.playwright = None
+        self.browser = None
+        self._contexts = None
+        self._start_lock = asyncio.Lock()
+        self._loop = loop
+        self._context_versions = {}
+    
+    async def _new_context(self):
+        """Create a context with a realistic user agent (and the resource filter, if enabled)
+        
+        Pooled contexts also serve form automation, which needs pages rendered in full,
+        so blocking is off by default and the scrape helpers filter their own pages.
+        """
+        options = self.context_options
+        if self._storage_state:
+            options = {**options, "storage_state": self._storage_state}
+        context = await self.browser.new_context(**options)
+        self._context_versions[context] = self._state_version
+        if self.block_resources:
+            await _route_resource_filter(context)
+        return context
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Check out a context for the duration of a task"""
+        await self.start()
+        context = await self._contexts.get()
+        if self._context_versions.get(context) != self._state_version:
+            # Another task signed in or out since this context was made
+            self._context_versions.pop(context, None)
+            with suppress(Exception):
+                await context.close()
+            context = await self._new_context()
+        try:
+            yield context
+        finally:
+            await self.release(context)
+    
+    async def release(self, context):
+        """Return a context to the pool, with its cookies cleared unless it shares a saved session
+        
+        In a session-sharing pool, a task that changed the session (signed in, refreshed a
+        token) has it saved from its own context, and the other contexts pick it up next checkout.
+        """
+        try:
+            if self.storage_state_path:
+                state = await context.storage_state()
+                if state != (self._storage_state or EMPTY_STORAGE_STATE):
+                    self._storage_state = state
+                    self._state_version += 1
+                    self._context_versions[context] = self._state_version
+                    await asyncio.to_thread(self._save_storage_state, state)
+            else:
+                await context.clear_cookies()
+        except Exception:
+            # Context is unusable (e.g. crashed page); replace it
+            self._context_versions.pop(context, None)
+            context = await self._new_context()
+        self._contexts.put_nowait(context)
+    
+    def _save_storage_state(self, state: Dict[str, Any]):
+        """Write the shared session where the next pool will read it"""
+        _ensure_dir(str(Path(self.storage_state_path).parent))
+        Path(self.storage_state_path).write_text(json.dumps(state))
+    
+    async def close(self):
+        """Close every pooled context and the browser"""
+        if self._loop is not asyncio.get_running_loop():
+            self._forget(None)
+            return
+        
+        # The session needs no saving here; release() wrote it whenever a task changed it
+        if self._contexts:
+            while not self._contexts.empty():
+                await self._contexts.get_nowait().close()
+            self._context_versions.clear()
+        
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+
 class BrowserTaskAutomation:
     """High-level browser task automation"""
     
-    def __init__(self):
-        self.browser = AidenBrowserAutomation()
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        self.pool = pool or browser_pool
     
     async def scrape_website_data(
         self, 
         url: str, 
         selectors: Dict[str, str],
-        take_screenshot: bool = True
+        take_screenshot: bool = True,
+        block_resources: bool = True
     ) -> BrowserResponse:
-        """Complete website scraping workflow"""
-        start_time = asyncio.get_event_loop().time()
+        """Complete website scraping workflow (images, fonts, media and trackers blocked by default)"""
+        start_time = time.perf_counter_ns()
         
         try:
-            # Initialize browser
-            init_result = await self.browser.initialize()
-            if not init_result.success:
-                return init_result
-            
-            # Navigate to website
-            nav_result = await self.browser.navigate_to(url)
-            if not nav_result.success:
-                return nav_result
-            
-            # Extract data
-            data_result = await self.browser.extract_data(selectors)
-            
-            screenshot_path = None
-            if take_screenshot:
-                screenshot_result = await self.browser.take_screenshot()
-                if screenshot_result.success:
-                    screenshot_path = screenshot_result.data["screenshot_path"]
-            
-            # Close browser
-            await self.browser.close()
+            async with self.pool.acquire() as context:
+                browser = AidenBrowserAutomation.for_page(await context.new_page())
+                try:
+                    # Routed on the page, so the filter goes away with it and the context stays unfiltered
+                    if block_resources and not self.pool.block_resources:
+                        await browser.set_resource_filter()
+                    
+                    # Navigate to website
+                    nav_result = await browser.navigate_to(url)
+                    if not nav_result.success:
+                        return nav_result
+                    
+                    # Extract data
+                    data_result = await browser.extract_data(selectors)
+                    
+                    screenshot_path = None
+                    if take_screenshot:
+                        screenshot_result = await browser.take_screenshot()
+                        if screenshot_result.success:
+                            screenshot_path = screenshot_result.data["screenshot_path"]
+                finally:
+                    await browser.page.close()
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=data_result.success,
@@ -490,61 +971,78 @@ class BrowserTaskAutomation:
             )
             
         except Exception as e:
-            await self.browser.close()
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
                 execution_time_ms=execution_time
             )
     
+    async def scrape_many(
+        self,
+        urls: List[str],
+        selectors: Dict[str, str],
+        concurrency: int = 10,
+        take_screenshot: bool = False
+    ) -> List[BrowserResponse]:
+        """Scrape many URLs concurrently, overlapping their network waits"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def scrape_one(url: str) -> BrowserResponse:
+            async with semaphore:
+                return await self.scrape_website_data(url, selectors, take_screenshot=take_screenshot)
+        
+        results = await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+        
+        # One response per URL, in input order
+        return [
+            result if isinstance(result, BrowserResponse)
+            else BrowserResponse(success=False, error=str(result), metadata={"url": url})
+            for url, result in zip(urls, results)
+        ]
+    
     async def automate_form_submission(
         self,
         url: str,
         form_data: Dict[str, str],
         submit_selector: str,
-        wait_after_submit: int = 3000
+        wait_after_submit: int = 3000,
+        include_html: bool = False
     ) -> BrowserResponse:
-        """Complete form automation workflow"""
-        start_time = asyncio.get_event_loop().time()
+        """Complete form automation workflow (final page HTML only with include_html)"""
+        start_time = time.perf_counter_ns()
         
         try:
-            # Initialize browser
-            init_result = await self.browser.initialize()
-            if not init_result.success:
-                return init_result
-            
-            # Navigate to form page
-            nav_result = await self.browser.navigate_to(url)
-            if not nav_result.success:
-                return nav_result
-            
-            # Fill form fields
-            fill_result = await self.browser.fill_form(form_data)
-            if not fill_result.success:
-                return fill_result
-            
-            # Take screenshot before submission
-            before_screenshot = await self.browser.take_screenshot(
-                path=f"logs/form_before_{int(datetime.now().timestamp())}.png"
-            )
-            
-            # Submit form
-            submit_result = await self.browser.click_element(submit_selector, wait_for_navigation=True)
-            
-            # Wait and take screenshot after submission
-            await asyncio.sleep(wait_after_submit / 1000)
-            after_screenshot = await self.browser.take_screenshot(
-                path=f"logs/form_after_{int(datetime.now().timestamp())}.png"
-            )
-            
-            # Get final page info
-            final_content = await self.browser.get_page_content()
-            
-            # Close browser
-            await self.browser.close()
+            async with self.pool.acquire() as context:
+                browser = AidenBrowserAutomation.for_page(await context.new_page())
+                try:
+                    # Navigate to form page
+                    nav_result = await browser.navigate_to(url)
+                    if not nav_result.success:
+                        return nav_result
+                    
+                    # Fill form fields
+                    fill_result = await browser.fill_form(form_data)
+                    if not fill_result.success:
+                        return fill_result
+                    
+                    # Take screenshot before submission (before/after share a sequence number)
+                    seq = f"{_SCREENSHOT_RUN}_{next(_SCREENSHOT_SEQ):06d}"
+                    before_screenshot = await browser.take_screenshot(path=f"logs/form_before_{seq}.jpg")
+                    
+                    # Submit form
+                    submit_result = await browser.click_element(submit_selector, wait_for_navigation=True)
+                    
+                    # Wait and take screenshot after submission
+                    await asyncio.sleep(wait_after_submit / 1000)
+                    after_screenshot = await browser.take_screenshot(path=f"logs/form_after_{seq}.jpg")
+                    
+                    # Get final page info
+                    final_content = await browser.get_page_content(include_html=include_html)
+                finally:
+                    await browser.page.close()
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             
             return BrowserResponse(
                 success=submit_result.success,
@@ -564,8 +1062,7 @@ class BrowserTaskAutomation:
             )
             
         except Exception as e:
-            await self.browser.close()
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = _elapsed_ms(start_time)
             return BrowserResponse(
                 success=False,
                 error=str(e),
@@ -576,25 +1073,34 @@ class BrowserTaskAutomation:
 # Global browser automation instance
 browser_automation = AidenBrowserAutomation()
 
+# Shared pool of warm browser contexts for task automation
+browser_pool = BrowserPool()
+
+# Task runner behind the quick_* helpers, so repeated calls reuse the warm pool
+_task_automation = BrowserTaskAutomation(browser_pool)
+
 
 async def quick_scrape(url: str, selectors: Dict[str, str]) -> BrowserResponse:
     """Quick website scraping function"""
-    task_automation = BrowserTaskAutomation()
-    return await task_automation.scrape_website_data(url, selectors)
+    return await _task_automation.scrape_website_data(url, selectors)
 
 
 async def quick_form_submit(url: str, form_data: Dict[str, str], submit_selector: str) -> BrowserResponse:
     """Quick form submission function"""
-    task_automation = BrowserTaskAutomation()
-    return await task_automation.automate_form_submission(url, form_data, submit_selector)
+    return await _task_automation.automate_form_submission(url, form_data, submit_selector)
 
 
 # Export key classes and functions
 __all__ = [
     "BrowserResponse",
     "AidenBrowserAutomation",
+    "BrowserPool",
     "BrowserTaskAutomation",
+    "DEFAULT_CONTEXT_OPTIONS",
+    "BLOCKED_RESOURCE_TYPES",
+    "BLOCKED_HOSTS",
     "browser_automation",
+    "browser_pool",
     "quick_scrape",
     "quick_form_submit",
     "PLAYWRIGHT_AVAILABLE"
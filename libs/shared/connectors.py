@@ -4,8 +4,13 @@ Bulletproof async API wrappers for all external services.
 """
 
 import asyncio
+import functools
+import random
+import time
 import httpx
-from typing import Dict, Any, Optional, List, Union
+from contextlib import asynccontextmanager, nullcontext
+from importlib.util import find_spec
+from typing import Dict, Any, Optional, List, Tuple, Union, AsyncIterator, Literal
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
@@ -14,68 +19,297 @@ from pathlib import Path
 
 from .secrets import secrets_manager
 
+# orjson encodes request bodies and decodes responses much faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# One keep-alive pool shared by every connector, so calls to the same host reuse
+# connections instead of paying a TCP/TLS handshake per connector. It is bound to
+# the event loop that created it and rebuilt if a different loop asks for it.
+# With the brotli package installed, httpx also advertises and decodes "br",
+# which compresses the large JSON completions much better than gzip. Over HTTP/2,
+# concurrent requests to one host multiplex on a single connection.
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_client_lock = asyncio.Lock()
+
+
+async def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for the running loop"""
+    global _shared_client, _shared_client_loop
+    
+    loop = asyncio.get_running_loop()
+    
+    # Steady state: the client exists for this loop, so skip the lock entirely
+    if _shared_client is not None and _shared_client_loop is loop:
+        return _shared_client
+    
+    # Cold start: concurrent first callers queue here and the re-check below
+    # lets only the first of them build the client
+    async with _shared_client_lock:
+        if _shared_client is None or _shared_client_loop is not loop:
+            _shared_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=200, keepalive_expiry=30.0)
+            )
+            _shared_client_loop = loop
+    return _shared_client
+
+
+async def _close_shared_client():
+    """Close the shared HTTP client, if one is open"""
+    global _shared_client, _shared_client_loop
+    
+    if _shared_client:
+        await _shared_client.aclose()
+        _shared_client = None
+        _shared_client_loop = None
+
+
+@dataclass(slots=True)
 class ConnectorResponse:
     """Standardized response format for all connectors"""
     success: bool
     data: Optional[Any] = None
     error: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None  # left unallocated when there is nothing to record
     timestamp: datetime = field(default_factory=datetime.now)
     connector: str = ""
     execution_time_ms: float = 0.0
+    
+    @property
+    def metadata_or_empty(self) -> Dict[str, Any]:
+        """Metadata, or an empty dict when none was recorded"""
+        return self.metadata if self.metadata is not None else {}
+
+
+# Transient failures worth another attempt, and the backoff between attempts (seconds)
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Honour a numeric Retry-After header, else back off exponentially with jitter"""
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall back to our own backoff
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.random() * RETRY_BASE_DELAY
+
+
+# How long a successful health check is reused before probing the service again (seconds)
+HEALTH_CACHE_TTL = 30.0
+
+# Resumable GCS upload chunk (must be a multiple of 256 KiB)
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def requires_secrets(*names: str, error: str):
+    """Short-circuit a connector method with a failed response unless the named secrets are set"""
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            secrets = self.secrets
+            for name in names:
+                if not getattr(secrets, name):
+                    return ConnectorResponse(success=False, error=error, connector=self.name)
+            return await method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: bursts up to capacity, then refill_rate requests per second"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    async def acquire(self):
+        """Wait until a request may be sent, then spend a token"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            
+            # Sleep just long enough for one token to accumulate
+            await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+    
+    def penalize(self):
+        """Back off after the provider rejected a request with 429"""
+        self.tokens = min(self.tokens, -1)
 
 
 class BaseConnector:
     """Base class for all API connectors"""
     
+    # Provider request limit; subclasses set it to throttle before the API does
+    requests_per_minute: Optional[int] = None
+    
+    # Most requests in flight at once; None leaves only the shared pool's limits
+    max_concurrency: Optional[int] = None
+    
+    # Secrets the auth headers are built from; headers are rebuilt only when these change
+    credential_fields: tuple = ()
+    
     def __init__(self, name: str):
         self.name = name
         self.secrets = secrets_manager.secrets
-        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Allow a second's worth of requests as a burst, refilling at the per-minute rate
+        self._bucket: Optional[TokenBucket] = None
+        if self.requests_per_minute:
+            rate = self.requests_per_minute / 60
+            self._bucket = TokenBucket(capacity=max(1.0, rate), refill_rate=rate)
+        
+        # Created on first use, and again if a different event loop makes requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        self._health_cache: Optional[Tuple[float, ConnectorResponse]] = None
+        
+        self._cached_headers = httpx.Headers()
+        self._cached_credentials: Optional[tuple] = None
+    
+    def _build_headers(self) -> httpx.Headers:
+        """Auth headers for this provider - override in subclasses"""
+        return httpx.Headers()
+    
+    def _auth_headers(self) -> httpx.Headers:
+        """Auth headers, built once and reused until a credential rotates
+        
+        Returned as httpx.Headers, whose values are already encoded to bytes, so
+        httpx copies them into each request instead of re-encoding every string.
+        """
+        credentials = tuple(getattr(self.secrets, name) for name in self.credential_fields)
+        if credentials != self._cached_credentials:
+            self._cached_headers = self._build_headers()
+            self._cached_credentials = credentials
+        return self._cached_headers
+    
+    def _concurrency_limit(self):
+        """The in-flight request limit for the running loop, or a no-op when unbounded"""
+        if not self.max_concurrency:
+            return nullcontext()
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if not self._client:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        """Get the HTTP client shared by all connectors"""
+        return await _get_shared_client()
     
     async def _make_request(
         self,
         method: str,
         url: str,
-        headers: Optional[Dict] = None,
+        headers: Optional[Union[Dict, httpx.Headers]] = None,
         data: Optional[Any] = None,
-        json_data: Optional[Dict] = None
+        json_data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        max_attempts: int = 2,
+        retry_unsafe: bool = False,
+        response_type: Literal["auto", "json", "text", "bytes"] = "auto"
     ) -> ConnectorResponse:
-        """Make HTTP request with standardized response"""
-        start_time = asyncio.get_event_loop().time()
+        """Make HTTP request with standardized response
+        
+        Transport errors and transient statuses are retried (GET/HEAD only, unless
+        retry_unsafe is set for requests known to be safe to repeat). A 429, or a 503
+        carrying Retry-After, is retried for any method, since the provider refused
+        the request without acting on it. The body is decoded by Content-Type unless
+        response_type names the form the caller wants.
+        """
+        start_time = time.perf_counter()
+        retryable = retry_unsafe or method.upper() in IDEMPOTENT_METHODS
+        
+        # Serialize the body once, with orjson when available, instead of per attempt via stdlib json
+        content = None
+        if json_data is not None and orjson:
+            content = orjson.dumps(json_data)
+            if not headers or "Content-Type" not in headers:
+                headers = httpx.Headers(headers)
+                headers["Content-Type"] = "application/json"
+            json_data = None
         
         try:
             client = await self._get_client()
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                json=json_data
-            )
             
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            for attempt in range(max_attempts):
+                last_attempt = attempt == max_attempts - 1
+                
+                if self._bucket:
+                    await self._bucket.acquire()
+                
+                try:
+                    async with self._concurrency_limit():
+                        response = await client.request(
+                            method=method,
+                            url=url,
+                            params=params,
+                            headers=headers,
+                            content=content,
+                            data=data,
+                            json=json_data
+                        )
+                except httpx.TransportError:
+                    if last_attempt or not retryable:
+                        raise
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                
+                status = response.status_code
+                if status == 429 and self._bucket:
+                    self._bucket.penalize()
+                
+                retry_after = response.headers.get("retry-after")
+                rejected = status == 429 or (status == 503 and retry_after is not None)
+                if last_attempt or status not in RETRY_STATUSES or not (retryable or rejected):
+                    break
+                await asyncio.sleep(_retry_delay(attempt, retry_after))
+            
+            execution_time = (time.perf_counter() - start_time) * 1000.0
             
             if response.status_code >= 400:
                 return ConnectorResponse(
                     success=False,
                     error=f"HTTP {response.status_code}: {response.text}",
                     connector=self.name,
-                    execution_time_ms=execution_time
+                    execution_time_ms=execution_time,
+                    metadata={"status_code": response.status_code}
                 )
             
-            try:
-                response_data = response.json()
-            except:
+            # Decode by declared type: JSON is parsed, text decoded, anything else (e.g. audio) kept as bytes
+            content_type = response.headers.get("content-type", "")
+            if response_type == "bytes":
+                response_data = response.content
+            elif response_type == "text":
                 response_data = response.text
+            elif response_type == "json" or "json" in content_type:
+                try:
+                    response_data = orjson.loads(response.content) if orjson else response.json()
+                except ValueError:
+                    response_data = response.text
+            elif not content_type or content_type.startswith("text/"):
+                response_data = response.text
+            else:
+                response_data = response.content
             
             return ConnectorResponse(
                 success=True,
@@ -86,7 +320,7 @@ class BaseConnector:
             )
             
         except Exception as e:
-            execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
+            execution_time = (time.perf_counter() - start_time) * 1000.0
             return ConnectorResponse(
                 success=False,
                 error=str(e),
@@ -94,8 +328,67 @@ class BaseConnector:
                 execution_time_ms=execution_time
             )
     
+    @asynccontextmanager
+    async def _stream(
+        self,
+        url: str,
+        headers: httpx.Headers,
+        payload: Dict
+    ) -> AsyncIterator[httpx.Response]:
+        """POST a JSON body and hold the response open for incremental reading
+        
+        Raises httpx.HTTPStatusError on an error status.
+        """
+        content = orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+        
+        client = await self._get_client()
+        if self._bucket:
+            await self._bucket.acquire()
+        
+        async with self._concurrency_limit():
+            async with client.stream("POST", url, headers=headers, content=content) as response:
+                if response.status_code >= 400:
+                    if response.status_code == 429 and self._bucket:
+                        self._bucket.penalize()
+                    await response.aread()
+                    response.raise_for_status()
+                yield response
+    
+    async def _stream_events(
+        self,
+        url: str,
+        headers: httpx.Headers,
+        payload: Dict
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST a streaming request and yield each server-sent event's JSON payload
+        
+        Raises httpx.HTTPStatusError on an error status; the stream ends at "[DONE]".
+        """
+        loads = orjson.loads if orjson else json.loads
+        
+        async with self._stream(url, headers, payload) as response:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue  # blank separators, "event:" names and keep-alive comments
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                if data:
+                    yield loads(data)
+    
     async def health_check(self) -> ConnectorResponse:
-        """Check connector health - override in subclasses"""
+        """Check connector health, reusing a successful result for HEALTH_CACHE_TTL seconds"""
+        if self._health_cache and time.monotonic() - self._health_cache[0] < HEALTH_CACHE_TTL:
+            return self._health_cache[1]
+        
+        response = await self._check_health()
+        
+        # Only successes are cached, so a failing service is probed again right away
+        self._health_cache = (time.monotonic(), response) if response.success else None
+        return response
+    
+    async def _check_health(self) -> ConnectorResponse:
+        """Probe connector health - override in subclasses"""
         return ConnectorResponse(
             success=True,
             data={"status": "healthy"},
@@ -103,32 +396,34 @@ class BaseConnector:
         )
     
     async def close(self):
-        """Close HTTP client"""
-        if self._client:
-            await self._client.aclose()
+        """Release connector resources (the shared HTTP client is closed by the manager)"""
 
 
 class OpenAIConnector(BaseConnector):
     """OpenAI API connector with full chat completions support"""
     
+    requests_per_minute = 3500
+    max_concurrency = 64
+    credential_fields = ("openai_api_key",)
+    
     def __init__(self):
         super().__init__("openai")
         self.base_url = "https://api.openai.com/v1"
     
-    async def health_check(self) -> ConnectorResponse:
+    def _build_headers(self) -> httpx.Headers:
+        return httpx.Headers({
+            "Authorization": f"Bearer {self.secrets.openai_api_key}",
+            "Content-Type": "application/json"
+        })
+    
+    @requires_secrets("openai_api_key", error="OpenAI API key not configured")
+    async def _check_health(self) -> ConnectorResponse:
         """Check OpenAI API health"""
-        if not self.secrets.openai_api_key:
-            return ConnectorResponse(
-                success=False,
-                error="OpenAI API key not configured",
-                connector=self.name
-            )
-        
         try:
             response = await self._make_request(
                 "GET",
                 f"{self.base_url}/models",
-                headers={"Authorization": f"Bearer {self.secrets.openai_api_key}"}
+                headers=self._auth_headers()
             )
             
             if response.success:
@@ -144,6 +439,7 @@ class OpenAIConnector(BaseConnector):
                 connector=self.name
             )
     
+    @requires_secrets("openai_api_key", error="OpenAI API key not configured")
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -153,13 +449,6 @@ class OpenAIConnector(BaseConnector):
         **kwargs
     ) -> ConnectorResponse:
         """Create chat completion"""
-        if not self.secrets.openai_api_key:
-            return ConnectorResponse(
-                success=False,
-                error="OpenAI API key not configured",
-                connector=self.name
-            )
-        
         payload = {
             "model": model,
             "messages": messages,
@@ -171,36 +460,68 @@ class OpenAIConnector(BaseConnector):
         return await self._make_request(
             "POST",
             f"{self.base_url}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.secrets.openai_api_key}",
-                "Content-Type": "application/json"
-            },
+            headers=self._auth_headers(),
             json_data=payload
         )
+    
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-4-turbo-preview",
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding text deltas as they are generated"""
+        if not self.secrets.openai_api_key:
+            raise ValueError("OpenAI API key not configured")
+        
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            **kwargs,
+            "stream": True
+        }
+        
+        async for event in self._stream_events(
+            f"{self.base_url}/chat/completions", self._auth_headers(), payload
+        ):
+            for choice in event.get("choices", ()):
+                delta = choice.get("delta", {}).get("content")
+                if delta:
+                    yield delta
 
 
 class AnthropicConnector(BaseConnector):
     """Anthropic Claude API connector"""
     
+    requests_per_minute = 1000
+    max_concurrency = 32
+    credential_fields = ("anthropic_api_key",)
+    
     def __init__(self):
         super().__init__("anthropic")
         self.base_url = "https://api.anthropic.com/v1"
     
-    async def health_check(self) -> ConnectorResponse:
+    def _build_headers(self) -> httpx.Headers:
+        return httpx.Headers({
+            "x-api-key": self.secrets.anthropic_api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        })
+    
+    @requires_secrets("anthropic_api_key", error="Anthropic API key not configured")
+    async def _check_health(self) -> ConnectorResponse:
         """Check Anthropic API health"""
-        if not self.secrets.anthropic_api_key:
-            return ConnectorResponse(
-                success=False,
-                error="Anthropic API key not configured",
-                connector=self.name
-            )
-        
         # Anthropic doesn't have a models endpoint, so we'll do a minimal message
         return await self.create_message(
             messages=[{"role": "user", "content": "Hi"}],
             max_tokens=5
         )
     
+    @requires_secrets("anthropic_api_key", error="Anthropic API key not configured")
     async def create_message(
         self,
         messages: List[Dict[str, str]],
@@ -209,13 +530,6 @@ class AnthropicConnector(BaseConnector):
         **kwargs
     ) -> ConnectorResponse:
         """Create Claude message"""
-        if not self.secrets.anthropic_api_key:
-            return ConnectorResponse(
-                success=False,
-                error="Anthropic API key not configured",
-                connector=self.name
-            )
-        
         payload = {
             "model": model,
             "messages": messages,
@@ -226,35 +540,66 @@ class AnthropicConnector(BaseConnector):
         return await self._make_request(
             "POST",
             f"{self.base_url}/messages",
-            headers={
-                "x-api-key": self.secrets.anthropic_api_key,
-                "Content-Type": "application/json",
-                "anthropic-version": "2023-06-01"
-            },
+            headers=self._auth_headers(),
             json_data=payload
         )
+    
+    async def create_message_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "claude-3-haiku-20240307",
+        max_tokens: int = 1000,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a Claude message, yielding text deltas as they are generated"""
+        if not self.secrets.anthropic_api_key:
+            raise ValueError("Anthropic API key not configured")
+        
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            **kwargs,
+            "stream": True
+        }
+        
+        async for event in self._stream_events(
+            f"{self.base_url}/messages", self._auth_headers(), payload
+        ):
+            if event.get("type") == "content_block_delta":
+                text = event.get("delta", {}).get("text")
+                if text:
+                    yield text
 
 
 class ElevenLabsConnector(BaseConnector):
     """ElevenLabs TTS API connector"""
     
+    requests_per_minute = 120
+    max_concurrency = 8
+    credential_fields = ("elevenlabs_api_key",)
+    
     def __init__(self):
         super().__init__("elevenlabs")
         self.base_url = "https://api.elevenlabs.io/v1"
     
-    async def health_check(self) -> ConnectorResponse:
+    def _build_headers(self) -> httpx.Headers:
+        headers = httpx.Headers({
+            "xi-api-key": self.secrets.elevenlabs_api_key,
+            "Content-Type": "application/json"
+        })
+        # Audio is already compressed, so TTS responses skip Content-Encoding altogether
+        self._tts_headers = headers.copy()
+        self._tts_headers["Accept-Encoding"] = "identity"
+        return headers
+    
+    @requires_secrets("elevenlabs_api_key", error="ElevenLabs API key not configured")
+    async def _check_health(self) -> ConnectorResponse:
         """Check ElevenLabs API health"""
-        if not self.secrets.elevenlabs_api_key:
-            return ConnectorResponse(
-                success=False,
-                error="ElevenLabs API key not configured",
-                connector=self.name
-            )
-        
         response = await self._make_request(
             "GET",
             f"{self.base_url}/voices",
-            headers={"xi-api-key": self.secrets.elevenlabs_api_key}
+            headers=self._auth_headers()
         )
         
         if response.success:
@@ -263,6 +608,7 @@ class ElevenLabsConnector(BaseConnector):
         
         return response
     
+    @requires_secrets("elevenlabs_api_key", error="ElevenLabs API key not configured")
     async def text_to_speech(
         self,
         text: str,
@@ -271,13 +617,6 @@ class ElevenLabsConnector(BaseConnector):
         **kwargs
     ) -> ConnectorResponse:
         """Convert text to speech"""
-        if not self.secrets.elevenlabs_api_key:
-            return ConnectorResponse(
-                success=False,
-                error="ElevenLabs API key not configured",
-                connector=self.name
-            )
-        
         voice_id = voice_id or self.secrets.elevenlabs_voice_id
         
         payload = {
@@ -290,48 +629,82 @@ class ElevenLabsConnector(BaseConnector):
             **kwargs
         }
         
+        self._auth_headers()  # rebuilds the TTS headers too if the key rotated
+        
         return await self._make_request(
             "POST",
             f"{self.base_url}/text-to-speech/{voice_id}",
-            headers={
-                "xi-api-key": self.secrets.elevenlabs_api_key,
-                "Content-Type": "application/json"
-            },
-            json_data=payload
+            headers=self._tts_headers,
+            json_data=payload,
+            response_type="bytes"
         )
+    
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        model_id: str = "eleven_monolingual_v1",
+        chunk_size: int = 4096,
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """Convert text to speech, yielding audio chunks as they arrive"""
+        if not self.secrets.elevenlabs_api_key:
+            raise ValueError("ElevenLabs API key not configured")
+        
+        voice_id = voice_id or self.secrets.elevenlabs_voice_id
+        
+        payload = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.5
+            },
+            **kwargs
+        }
+        
+        self._auth_headers()  # rebuilds the TTS headers too if the key rotated
+        
+        async with self._stream(
+            f"{self.base_url}/text-to-speech/{voice_id}/stream", self._tts_headers, payload
+        ) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
 
 
 class SupabaseConnector(BaseConnector):
     """Supabase API connector"""
     
+    max_concurrency = 32
+    credential_fields = ("supabase_service_role_key",)
+    
     def __init__(self):
         super().__init__("supabase")
     
-    async def health_check(self) -> ConnectorResponse:
+    def _build_headers(self) -> httpx.Headers:
+        return httpx.Headers({
+            "apikey": self.secrets.supabase_service_role_key,
+            "Authorization": f"Bearer {self.secrets.supabase_service_role_key}",
+            "Content-Type": "application/json"
+        })
+    
+    @requires_secrets("supabase_url", "supabase_service_role_key", error="Supabase credentials not configured")
+    async def _check_health(self) -> ConnectorResponse:
         """Check Supabase connection"""
-        if not (self.secrets.supabase_url and self.secrets.supabase_service_role_key):
-            return ConnectorResponse(
-                success=False,
-                error="Supabase credentials not configured",
-                connector=self.name
-            )
-        
         response = await self._make_request(
             "GET",
             f"{self.secrets.supabase_url}/rest/v1/",
-            headers={
-                "apikey": self.secrets.supabase_service_role_key,
-                "Authorization": f"Bearer {self.secrets.supabase_service_role_key}"
-            }
+            headers=self._auth_headers()
         )
         
-        if response.success or response.metadata.get("status_code") == 404:
+        if response.success or response.metadata_or_empty.get("status_code") == 404:
             response.success = True
             response.data = {"status": "healthy", "connection": "established"}
             response.error = None
         
         return response
     
+    @requires_secrets("supabase_url", "supabase_service_role_key", error="Supabase credentials not configured")
     async def query(
         self,
         table: str,
@@ -340,45 +713,23 @@ class SupabaseConnector(BaseConnector):
         **kwargs
     ) -> ConnectorResponse:
         """Query Supabase table"""
-        if not (self.secrets.supabase_url and self.secrets.supabase_service_role_key):
-            return ConnectorResponse(
-                success=False,
-                error="Supabase credentials not configured",
-                connector=self.name
-            )
-        
-        url = f"{self.secrets.supabase_url}/rest/v1/{table}?select={select}"
-        
-        if filters:
-            for key, value in filters.items():
-                url += f"&{key}={value}"
+        # httpx builds and URL-encodes the query string (values may contain & = % or Unicode)
+        params = {"select": select, **(filters or {})}
         
         return await self._make_request(
             "GET",
-            url,
-            headers={
-                "apikey": self.secrets.supabase_service_role_key,
-                "Authorization": f"Bearer {self.secrets.supabase_service_role_key}"
-            }
+            f"{self.secrets.supabase_url}/rest/v1/{table}",
+            params=params,
+            headers=self._auth_headers()
         )
     
+    @requires_secrets("supabase_url", "supabase_service_role_key", error="Supabase credentials not configured")
     async def insert(self, table: str, data: Dict) -> ConnectorResponse:
         """Insert data into Supabase table"""
-        if not (self.secrets.supabase_url and self.secrets.supabase_service_role_key):
-            return ConnectorResponse(
-                success=False,
-                error="Supabase credentials not configured",
-                connector=self.name
-            )
-        
         return await self._make_request(
             "POST",
             f"{self.secrets.supabase_url}/rest/v1/{table}",
-            headers={
-                "apikey": self.secrets.supabase_service_role_key,
-                "Authorization": f"Bearer {self.secrets.supabase_service_role_key}",
-                "Content-Type": "application/json"
-            },
+            headers=self._auth_headers(),
             json_data=data
         )
 
@@ -389,15 +740,24 @@ class GoogleCloudConnector(BaseConnector):
     def __init__(self):
         super().__init__("google_cloud")
         self.project_id = self.secrets.gcp_project_id or "gen-lang-client-0093497568"
+        self._storage_client = None
+        self._storage_lock = asyncio.Lock()
     
-    async def health_check(self) -> ConnectorResponse:
+    async def _get_storage_client(self):
+        """Create the (synchronous) storage client once, off the event loop"""
+        async with self._storage_lock:
+            if self._storage_client is None:
+                from google.cloud import storage
+                self._storage_client = await asyncio.to_thread(storage.Client, project=self.project_id)
+        return self._storage_client
+    
+    async def _check_health(self) -> ConnectorResponse:
         """Check Google Cloud connectivity"""
         try:
-            from google.cloud import storage
-            client = storage.Client(project=self.project_id)
+            client = await self._get_storage_client()
             
-            # Test with list buckets
-            buckets = list(client.list_buckets(max_results=1))
+            # Test with list buckets (the storage client blocks, so run it in a thread)
+            buckets = await asyncio.to_thread(lambda: list(client.list_buckets(max_results=1)))
             
             return ConnectorResponse(
                 success=True,
@@ -421,10 +781,9 @@ class GoogleCloudConnector(BaseConnector):
     async def create_bucket(self, bucket_name: str, location: str = "US") -> ConnectorResponse:
         """Create Google Cloud Storage bucket"""
         try:
-            from google.cloud import storage
-            client = storage.Client(project=self.project_id)
+            client = await self._get_storage_client()
             
-            bucket = client.create_bucket(bucket_name, location=location)
+            bucket = await asyncio.to_thread(client.create_bucket, bucket_name, location=location)
             
             return ConnectorResponse(
                 success=True,
@@ -449,17 +808,24 @@ class GoogleCloudConnector(BaseConnector):
     ) -> ConnectorResponse:
         """Upload file to Google Cloud Storage"""
         try:
-            from google.cloud import storage
-            client = storage.Client(project=self.project_id)
+            client = await self._get_storage_client()
             
             bucket = client.bucket(bucket_name)
             blob = bucket.blob(blob_name)
             
-            with open(file_path, 'rb') as f:
-                blob.upload_from_file(f, content_type=content_type)
+            def upload():
+                # File read, upload and ACL change all block, so they run together in a thread.
+                # Large files go up as a chunked resumable upload rather than one buffered body.
+                if Path(file_path).stat().st_size > GCS_UPLOAD_CHUNK_SIZE:
+                    blob.chunk_size = GCS_UPLOAD_CHUNK_SIZE
+                blob.upload_from_filename(
+                    file_path, content_type=content_type, timeout=120, checksum="crc32c"
+                )
+                
+                if make_public:
+                    blob.make_public()
             
-            if make_public:
-                blob.make_public()
+            await asyncio.to_thread(upload)
             
             public_url = f"https://storage.googleapis.com/{bucket_name}/{blob_name}"
             
@@ -496,23 +862,21 @@ class UnifiedConnectorManager:
     
     async def health_check_all(self) -> Dict[str, ConnectorResponse]:
         """Run health checks on all connectors"""
-        results = {}
+        # Probe every service at once; the slowest connector bounds the total time
+        outcomes = await asyncio.gather(
+            *(connector.health_check() for connector in self.connectors.values()),
+            return_exceptions=True
+        )
         
-        tasks = [
-            (name, connector.health_check())
-            for name, connector in self.connectors.items()
-        ]
-        
-        for name, task in tasks:
-            try:
-                result = await task
-                results[name] = result
-            except Exception as e:
-                results[name] = ConnectorResponse(
+        results = {}
+        for name, outcome in zip(self.connectors, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = ConnectorResponse(
                     success=False,
-                    error=str(e),
+                    error=str(outcome),
                     connector=name
                 )
+            results[name] = outcome
         
         return results
     
@@ -524,6 +888,7 @@ class UnifiedConnectorManager:
         """Close all connector connections"""
         for connector in self.connectors.values():
             await connector.close()
+        await _close_shared_client()
     
     async def __aenter__(self):
         return self
@@ -549,6 +914,7 @@ async def health_check_all_connectors() -> Dict[str, ConnectorResponse]:
 # Export key classes and functions
 __all__ = [
     "ConnectorResponse",
+    "TokenBucket",
     "BaseConnector", 
     "OpenAIConnector",
     "AnthropicConnector", 
@@ -3,13 +3,16 @@
 Aiden Pro Demo Creator & Screen Recorder
 Create amazing demos and advertisements automatically
 """
-import os, json, subprocess, tempfile, time
+import os, sys, json, platform, shutil, subprocess, tempfile, time
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from dataclasses import dataclass
 import threading
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import importlib.metadata
 
 try:
     import cv2
@@ -23,7 +26,57 @@ try:
 except ImportError:
     MEDIA_DEPENDENCIES_AVAILABLE = False
 
-@dataclass
+# mss grabs frames fast enough to pipe them straight into ffmpeg while recording
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+
+def _distribution_version(name: str) -> Optional[str]:
+    """Installed version of a distribution, or None when it is not installed"""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_encoders(ffmpeg: str) -> frozenset:
+    """Encoder names compiled into an ffmpeg binary (empty if it cannot be run)"""
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+    
+    # Encoder lines look like " V....D h264_nvenc    NVIDIA NVENC H.264 encoder"
+    return frozenset(
+        fields[1] for fields in map(str.split, result.stdout.splitlines()) if len(fields) > 1
+    )
+
+
+@lru_cache(maxsize=None)
+def _h264_encoder(ffmpeg: str = "ffmpeg") -> str:
+    """Hardware H.264 encoder this ffmpeg build offers on this host, else x264
+    
+    Stock and distro ffmpeg builds often lack NVENC, so the binary is asked rather than assumed.
+    """
+    encoders = _ffmpeg_encoders(ffmpeg)
+    if sys.platform == "darwin" and "h264_videotoolbox" in encoders:
+        return "h264_videotoolbox"
+    # NVENC also needs the NVIDIA driver, which ships nvidia-smi
+    if "h264_nvenc" in encoders and shutil.which("nvidia-smi"):
+        return "h264_nvenc"
+    return "libx264"
+
+
+# Seconds a recorder may run past its duration to finish writing before it is stopped
+RECORDING_STOP_GRACE = 5
+
+@dataclass(slots=True, frozen=True)
 class DemoScene:
     name: str
     duration: float
@@ -31,9 +84,9 @@ class DemoScene:
     actions: List[Dict]  # mouse, keyboard, wait, highlight actions
     voiceover: str
     background_music: str = ""
-    transitions: Dict = None
+    transitions: Optional[Dict] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DemoProject:
     name: str
     description: str
@@ -123,11 +176,12 @@ class DemoCreator:
                 }
             )
             
-            # Record the demo
-            recording_result = self._record_aiden_demo(project)
-            
-            # Generate voiceover
-            voiceover_result = self._generate_voiceover(project)
+            # Record the demo in the background while the voiceover is generated
+            # (pyttsx3 stays on this thread, which its macOS driver expects)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                recording_future = executor.submit(self._record_aiden_demo, project)
+                voiceover_result = self._generate_voiceover(project)
+                recording_result = recording_future.result()
             
             # Create final video
             video_result = self._create_final_video(project, recording_result, voiceover_result)
@@ -158,11 +212,16 @@ class DemoCreator:
             output_path = self.recordings_dir / f"{demo_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
             
             # Start recording
-            recording_result = self._start_screen_recording(output_path, region, duration, with_audio)
+            recording_result = asyncio.run(
+                self._start_screen_recording(output_path, region, duration, with_audio)
+            )
             
             if recording_result.get("success"):
-                # Process recording
-                processed_result = self._process_recording(output_path)
+                # Frames piped through ffmpeg are already encoded; only screencapture output needs processing
+                if recording_result.get("encoded"):
+                    processed_result = {"success": True}
+                else:
+                    processed_result = self._process_recording(output_path)
                 
                 return {
                     "success": True,
@@ -425,14 +484,85 @@ class DemoCreator:
         
         return scenes
     
-    def _start_screen_recording(self, output_path: Path, region: tuple, 
-                              duration: int, with_audio: bool) -> Dict:
+    async def _start_screen_recording(self, output_path: Path, region: tuple, 
+                                    duration: int, with_audio: bool, fps: int = 30) -> Dict:
+        """Record the screen region without blocking the event loop"""
+        if not MSS_AVAILABLE:
+            return await self._start_screencapture_recording(output_path, region, duration, with_audio)
+        
+        return await asyncio.to_thread(
+            self._pipe_screen_to_ffmpeg, output_path, region, duration, with_audio, fps
+        )
+    
+    def _pipe_screen_to_ffmpeg(self, output_path: Path, region: tuple, 
+                               duration: int, with_audio: bool, fps: int) -> Dict:
+        """Capture frames with mss, encoding them to H.264 as they are captured"""
+        try:
+            monitor = {"left": region[0], "top": region[1], "width": region[2], "height": region[3]}
+            
+            with mss.mss() as sct:
+                # The grab size is in physical pixels (2x the region on Retina displays)
+                frame = sct.grab(monitor)
+                width, height = frame.size
+                
+                cmd = [
+                    "ffmpeg", "-y", "-loglevel", "error",
+                    "-f", "rawvideo", "-pix_fmt", "bgra",
+                    "-s", f"{width}x{height}", "-r", str(fps),
+                    "-i", "-"
+                ]
+                if with_audio and sys.platform == "darwin":
+                    cmd += ["-f", "avfoundation", "-i", ":0", "-c:a", "aac", "-shortest"]
+                cmd += [
+                    "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",  # H.264 needs even dimensions
+                    "-pix_fmt", "yuv420p",
+                    "-c:v", _h264_encoder(), "-b:v", "8M",
+                    str(output_path)
+                ]
+                
+                process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                
+                start = time.monotonic()
+                written = 0
+                try:
+                    while written < duration * fps:
+                        # Repeat the latest frame when a grab runs late, so the video keeps real time
+                        due = min(int((time.monotonic() - start) * fps) + 1, duration * fps)
+                        for _ in range(due - written):
+                            process.stdin.write(frame.raw)
+                        written = due
+                        
+                        delay = start + written / fps - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                        frame = sct.grab(monitor)
+                except BrokenPipeError:
+                    pass  # ffmpeg exited early; its exit status below says why
+                finally:
+                    # Always reap ffmpeg, even if a grab failed mid-recording
+                    try:
+                        process.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    returncode = process.wait()
+            
+            if returncode != 0:
+                return {"error": f"ffmpeg exited with status {returncode}"}
+            
+            return {"success": True, "process_id": process.pid, "encoded": True, "frames": written}
+            
+        except Exception as e:
+            return {"error": str(e)}
+    
+    async def _start_screencapture_recording(self, output_path: Path, region: tuple, 
+                                           duration: int, with_audio: bool) -> Dict:
         """Start screen recording using system tools"""
         try:
             # Use macOS screen recording
             cmd = [
                 "screencapture", 
                 "-v",  # Video
+                "-V", str(duration),  # Stop on its own after duration seconds
                 "-r", "30",  # Frame rate
                 "-R", f"{region[0]},{region[1]},{region[2]},{region[3]}",  # Region
                 str(output_path)
@@ -441,16 +571,16 @@ class DemoCreator:
             if with_audio:
                 cmd.append("-a")  # Audio
             
-            # Start recording in background
-            process = subprocess.Popen(cmd)
-            
-            # Wait for specified duration
-            time.sleep(duration)
+            process = await asyncio.create_subprocess_exec(*cmd)
             
-            # Stop recording
-            process.terminate()
+            # Let the recorder finish and flush the file; only stop it if it overruns
+            try:
+                await asyncio.wait_for(process.wait(), timeout=duration + RECORDING_STOP_GRACE)
+            except asyncio.TimeoutError:
+                process.terminate()
+                await process.wait()
             
-            return {"success": True, "process_id": process.pid}
+            return {"success": True, "process_id": process.pid, "returncode": process.returncode}
             
         except Exception as e:
             return {"error": str(e)}
@@ -463,16 +593,16 @@ class DemoCreator:
         try:
             voiceover_files = []
             
+            # Queue every scene, then synthesize them all in one driver session
             for scene in project.scenes:
                 if scene.voiceover:
                     audio_path = self.assets_dir / f"{project.name}_{scene.name}_voice.wav"
-                    
-                    # Generate speech
                     self.tts_engine.save_to_file(scene.voiceover, str(audio_path))
-                    self.tts_engine.runAndWait()
-                    
                     voiceover_files.append(str(audio_path))
             
+            if voiceover_files:
+                self.tts_engine.runAndWait()
+            
             return {
                 "success": True,
                 "files": voiceover_files,
@@ -514,31 +644,49 @@ class DemoCreator:
         
         return specs.get(platform, specs["youtube"])
     
-    def install_dependencies(self) -> Dict:
-        """Install required dependencies for demo creation"""
+    def install_dependencies(self, pillow_simd: bool = False) -> Dict:
+        """Install required dependencies for demo creation
+        
+        With pillow_simd, stock Pillow is replaced by the AVX2 Pillow-SIMD build on
+        x86-64. That swaps out a core package in the interpreter, so it is opt-in.
+        """
         try:
+            simd_installed = _distribution_version("Pillow-SIMD") is not None
+            
             packages = [
                 "opencv-python",
-                "pillow",
+                # Pillow-SIMD provides the same PIL package; installing "pillow" over it would clobber it
+                *([] if simd_installed else ["pillow"]),
                 "moviepy",
                 "pyautogui",
                 "pyttsx3",
-                "numpy"
+                "numpy",
+                "mss"
             ]
             
             installed = []
             failed = []
             
-            for package in packages:
-                try:
-                    subprocess.run(
-                        ["pip", "install", package],
-                        capture_output=True,
-                        check=True
-                    )
-                    installed.append(package)
-                except subprocess.CalledProcessError:
-                    failed.append(package)
+            pip = [sys.executable, "-m", "pip", "install", "--quiet", "--no-input"]
+            
+            # One resolver pass for everything; already-satisfied packages cost almost nothing
+            result = subprocess.run([*pip, *packages], capture_output=True)
+            if result.returncode == 0:
+                installed.extend(packages)
+            else:
+                # Something failed - retry one by one to find out which
+                for package in packages:
+                    if subprocess.run([*pip, package], capture_output=True).returncode == 0:
+                        installed.append(package)
+                    else:
+                        failed.append(package)
+            
+            # Pillow-SIMD accelerates resize/alpha_composite/blend with AVX2 (x86-64 only). It
+            # replaces Pillow's files, so it goes in after everything that depends on Pillow
+            if (pillow_simd and not simd_installed and "pillow" in installed
+                    and platform.machine().lower() in ("x86_64", "amd64")):
+                if self._swap_in_pillow_simd(pip):
+                    installed.append("pillow-simd")
             
             # Install FFmpeg for video processing
             try:
@@ -556,6 +704,26 @@ class DemoCreator:
         except Exception as e:
             return {"error": str(e)}
     
+    def _swap_in_pillow_simd(self, pip: List[str]) -> bool:
+        """Replace Pillow with Pillow-SIMD, leaving Pillow untouched unless the SIMD build succeeds"""
+        with tempfile.TemporaryDirectory() as wheel_dir:
+            # Build the wheel first: a missing compiler or network fails here, before anything is removed
+            build = subprocess.run(
+                [sys.executable, "-m", "pip", "wheel", "--quiet", "--no-input", "--no-deps",
+                 "--wheel-dir", wheel_dir, "pillow-simd"],
+                capture_output=True
+            )
+            wheels = list(Path(wheel_dir).glob("*.whl"))
+            if build.returncode != 0 or not wheels:
+                return False
+            
+            subprocess.run([sys.executable, "-m", "pip", "uninstall", "-y", "--quiet", "pillow"], capture_output=True)
+            if subprocess.run([*pip, "--no-deps", str(wheels[0])], capture_output=True).returncode == 0:
+                return True
+        
+        subprocess.run([*pip, "pillow"], capture_output=True)
+        return False
+    
     def get_demo_templates(self) -> Dict:
         """Get available demo templates"""
         return {
@@ -16,16 +16,48 @@ Usage:
     # Download file
     success = download_file("my-bucket", "data/model.pkl", "/local/cache/model.pkl")
 """
+import io
 import os
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from base64 import b64decode
 from typing import Optional, Union
 
+# orjson serializes straight to bytes, skipping the intermediate str and its UTF-8 encode
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Lazy imports to avoid dependency issues
 _storage_client = None
 _project_id = None
 
+# Keep-alive connections held open for reuse across calls (and across backup threads)
+HTTP_POOL_SIZE = 16
+
+# Payloads at least this large go up as chunked resumable uploads, so a transient
+# error resends one chunk instead of the whole object (chunks are multiples of 256 KiB)
+RESUMABLE_THRESHOLD = 4 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Concurrent uploads in backup_logs_to_gcs (kept within HTTP_POOL_SIZE)
+BACKUP_WORKERS = 8
+
+def _authorized_session(scopes, credentials=None):
+    """Authorized requests session with a connection pool sized for concurrent uploads"""
+    import google.auth
+    from google.auth.transport.requests import AuthorizedSession
+    from requests.adapters import HTTPAdapter
+    
+    if credentials is None:
+        credentials, _ = google.auth.default(scopes=scopes)
+    session = AuthorizedSession(credentials)
+    session.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+    return session
+
 def _ensure_credentials():
     """Ensure GCP credentials are available"""
     global _storage_client, _project_id
@@ -33,31 +65,44 @@ def _ensure_credentials():
     if _storage_client is not None:
         return _storage_client
     
-    # Try to materialize service account file from base64 env var
     gcp_sa_b64 = os.getenv("GCP_SA_JSON_BASE64")
     gcp_sa_path = os.getenv("GCP_SA_PATH", "/tmp/gcp_sa.json")
     _project_id = os.getenv("GCP_PROJECT_ID")
     
+    # Service account from the base64 env var is parsed in memory, never written to disk
+    sa_info = None
     if gcp_sa_b64:
         try:
-            sa_json = b64decode(gcp_sa_b64).decode('utf-8')
-            Path(gcp_sa_path).write_text(sa_json)
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = gcp_sa_path
-            print(f"✓ Materialized GCP service account to {gcp_sa_path}")
+            sa_info = json.loads(b64decode(gcp_sa_b64))
         except Exception as e:
-            print(f"⚠️  Could not materialize GCP service account: {e}")
-    
-    # Check if credentials file exists
-    creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", gcp_sa_path)
-    if not Path(creds_path).exists():
-        raise RuntimeError(
-            f"GCP service account not found at {creds_path}. "
-            f"Set GCP_SA_JSON_BASE64 or ensure {creds_path} exists."
-        )
+            print(f"⚠️  Could not decode GCP service account: {e}")
+    
+    # Otherwise fall back to a credentials file
+    if sa_info is None:
+        creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", gcp_sa_path)
+        if not Path(creds_path).exists():
+            raise RuntimeError(
+                f"GCP service account not found at {creds_path}. "
+                f"Set GCP_SA_JSON_BASE64 or ensure {creds_path} exists."
+            )
+        os.environ.setdefault("GOOGLE_APPLICATION_CREDENTIALS", creds_path)
     
     try:
         from google.cloud import storage
-        _storage_client = storage.Client(project=_project_id)
+        
+        credentials = None
+        if sa_info is not None:
+            from google.oauth2 import service_account
+            credentials = service_account.Credentials.from_service_account_info(
+                sa_info, scopes=storage.Client.SCOPE
+            )
+            _project_id = _project_id or sa_info.get("project_id")
+        
+        _storage_client = storage.Client(
+            project=_project_id,
+            credentials=credentials,
+            _http=_authorized_session(storage.Client.SCOPE, credentials)
+        )
         print(f"✓ GCS client initialized for project {_project_id}")
         return _storage_client
     except ImportError:
@@ -65,6 +110,11 @@ def _ensure_credentials():
     except Exception as e:
         raise RuntimeError(f"Failed to initialize GCS client: {e}")
 
+@functools.lru_cache(maxsize=32)
+def _get_bucket(bucket_name: str):
+    """Bucket handle, created once per name"""
+    return _ensure_credentials().bucket(bucket_name)
+
 def upload_bytes(bucket_name: str, destination_path: str, data: Union[bytes, str], 
                 content_type: str = "application/octet-stream") -> str:
     """
@@ -79,15 +129,18 @@ def upload_bytes(bucket_name: str, destination_path: str, data: Union[bytes, str
     Returns:
         gs:// URL of uploaded object
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(destination_path)
     
     if isinstance(data, str):
         data = data.encode('utf-8')
     
     try:
-        blob.upload_from_string(data, content_type=content_type)
+        if len(data) < RESUMABLE_THRESHOLD:
+            blob.upload_from_string(data, content_type=content_type)
+        else:
+            blob.chunk_size = UPLOAD_CHUNK_SIZE
+            blob.upload_from_file(io.BytesIO(data), size=len(data), content_type=content_type)
         return f"gs://{bucket_name}/{destination_path}"
     except Exception as e:
         raise RuntimeError(f"Failed to upload to gs://{bucket_name}/{destination_path}: {e}")
@@ -104,8 +157,7 @@ def upload_file(bucket_name: str, destination_path: str, local_path: Union[str,
     Returns:
         gs:// URL of uploaded object
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(destination_path)
     
     local_file = Path(local_path)
@@ -113,6 +165,8 @@ def upload_file(bucket_name: str, destination_path: str, local_path: Union[str,
         raise FileNotFoundError(f"Local file not found: {local_file}")
     
     try:
+        if local_file.stat().st_size >= RESUMABLE_THRESHOLD:
+            blob.chunk_size = UPLOAD_CHUNK_SIZE
         blob.upload_from_filename(str(local_file))
         return f"gs://{bucket_name}/{destination_path}"
     except Exception as e:
@@ -130,8 +184,7 @@ def download_file(bucket_name: str, source_path: str, local_path: Union[str, Pat
     Returns:
         True if download successful
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(source_path)
     
     local_file = Path(local_path)
@@ -155,8 +208,7 @@ def download_bytes(bucket_name: str, source_path: str) -> Optional[bytes]:
     Returns:
         File content as bytes, or None if failed
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(source_path)
     
     try:
@@ -176,8 +228,7 @@ def list_objects(bucket_name: str, prefix: str = "") -> list[str]:
     Returns:
         List of object paths
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     
     try:
         blobs = bucket.list_blobs(prefix=prefix)
@@ -197,8 +248,7 @@ def delete_object(bucket_name: str, object_path: str) -> bool:
     Returns:
         True if deletion successful
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(object_path)
     
     try:
@@ -219,8 +269,7 @@ def object_exists(bucket_name: str, object_path: str) -> bool:
     Returns:
         True if object exists
     """
-    client = _ensure_credentials()
-    bucket = client.bucket(bucket_name)
+    bucket = _get_bucket(bucket_name)
     blob = bucket.blob(object_path)
     
     try:
@@ -245,15 +294,31 @@ def backup_logs_to_gcs(bucket_name: str, local_logs_dir: Union[str, Path] = "log
     if not logs_path.exists():
         return []
     
+    log_files = list(logs_path.glob("*.log"))
+    if not log_files:
+        return []
+    
+    # Create the client and bucket before fanning out, so the workers share them
+    try:
+        _get_bucket(bucket_name)
+    except Exception as e:
+        print(f"✗ Failed to backup logs: {e}")
+        return []
+    
     uploaded = []
-    for log_file in logs_path.glob("*.log"):
-        try:
-            destination = f"backups/logs/{log_file.name}"
-            url = upload_file(bucket_name, destination, log_file)
-            uploaded.append(url)
-            print(f"✓ Backed up {log_file.name} to {url}")
-        except Exception as e:
-            print(f"✗ Failed to backup {log_file.name}: {e}")
+    with ThreadPoolExecutor(max_workers=min(BACKUP_WORKERS, len(log_files))) as executor:
+        futures = {
+            executor.submit(upload_file, bucket_name, f"backups/logs/{log_file.name}", log_file): log_file
+            for log_file in log_files
+        }
+        for future in as_completed(futures):
+            log_file = futures[future]
+            try:
+                url = future.result()
+                uploaded.append(url)
+                print(f"✓ Backed up {log_file.name} to {url}")
+            except Exception as e:
+                print(f"✗ Failed to backup {log_file.name}: {e}")
     
     return uploaded
 
@@ -269,5 +334,9 @@ def upload_json_data(bucket_name: str, destination_path: str, data: dict) -> str
     Returns:
         gs:// URL of uploaded object
     """
-    json_bytes = json.dumps(data, indent=2).encode('utf-8')
+    # OPT_NON_STR_KEYS keeps int/float/bool dict keys working the way json.dumps does
+    if orjson:
+        json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        json_bytes = json.dumps(data, indent=2).encode('utf-8')
     return upload_bytes(bucket_name, destination_path, json_bytes, "application/json")
\ No newline at end of file